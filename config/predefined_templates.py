@@ -3,7 +3,45 @@ Predefined Templates for AWS Services
 Chứa các template mặc định cho AWS services và infrastructure patterns
 """
 
-from typing import Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+try:
+    # frozendict (C extension) nhanh hơn khi tạo/iterate; optional dependency
+    from frozendict import frozendict as _FrozenMapping
+except ImportError:
+    _FrozenMapping = MappingProxyType
+
+
+def _freeze(value: Any) -> Any:
+    """Đóng băng nested dicts thành read-only mappings (frozendict hoặc MappingProxyType)"""
+    if isinstance(value, dict):
+        return _FrozenMapping({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Chuyển nested read-only mappings về dict thường để caller có thể sửa"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+# Các giá trị lặp lại nhiều lần trong templates - intern để share một string object
+_US_EAST_NV = sys.intern("US East (N. Virginia)")
+_LINUX = sys.intern("Linux")
+_GP3 = sys.intern("gp3")
+_GB = sys.intern("GB")
+_MYSQL = sys.intern("MySQL")
+_SINGLE_AZ = sys.intern("Single-AZ")
+_STANDARD = sys.intern("Standard")
+_ALB = sys.intern("Application Load Balancer")
+_INTERNET_FACING = sys.intern("Internet-facing")
+
+# Sub-configs giống hệt nhau giữa các infrastructure templates - share một read-only mapping
+# (_freeze giữ nguyên object đã frozen)
+_INTERNET_FACING_ALB = _FrozenMapping({"type": _ALB, "scheme": _INTERNET_FACING})
 
 
 # PREDEFINED TEMPLATES cho từng AWS service
@@ -12,74 +50,74 @@ PREDEFINED_TEMPLATES = {
         "default": {
             "instance_type": "t3.medium",
             "quantity": 1,
-            "operating_system": "Linux",
-            "storage_type": "gp3",
+            "operating_system": _LINUX,
+            "storage_type": _GP3,
             "storage_size": "20",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         },
         "web_server": {
             "instance_type": "t3.medium",
             "quantity": 2,
-            "operating_system": "Linux",
-            "storage_type": "gp3",
+            "operating_system": _LINUX,
+            "storage_type": _GP3,
             "storage_size": "30",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         },
         "database_server": {
             "instance_type": "r5.large",
             "quantity": 1,
-            "operating_system": "Linux",
-            "storage_type": "gp3",
+            "operating_system": _LINUX,
+            "storage_type": _GP3,
             "storage_size": "100",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         }
     },
     
     "rds": {
         "default": {
-            "engine": "MySQL",
+            "engine": _MYSQL,
             "instance_class": "db.t3.micro",
-            "deployment": "Single-AZ",
-            "storage_type": "gp3",
+            "deployment": _SINGLE_AZ,
+            "storage_type": _GP3,
             "storage_amount": "20",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         },
         "postgresql": {
             "engine": "PostgreSQL",
             "instance_class": "db.t3.small",
-            "deployment": "Single-AZ",
-            "storage_type": "gp3",
+            "deployment": _SINGLE_AZ,
+            "storage_type": _GP3,
             "storage_amount": "50",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         },
         "production": {
-            "engine": "MySQL",
+            "engine": _MYSQL,
             "instance_class": "db.r5.large",
             "deployment": "Multi-AZ",
-            "storage_type": "gp3",
+            "storage_type": _GP3,
             "storage_amount": "100",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "region": _US_EAST_NV
         }
     },
     
     "s3": {
         "default": {
             "storage_amount": 100,
-            "storage_unit": "GB",
-            "storage_class": "Standard",
-            "region": "US East (N. Virginia)"
+            "storage_unit": _GB,
+            "storage_class": _STANDARD,
+            "region": _US_EAST_NV
         },
         "backup": {
             "storage_amount": 500,
-            "storage_unit": "GB",
+            "storage_unit": _GB,
             "storage_class": "Standard-IA",
-            "region": "US East (N. Virginia)"
+            "region": _US_EAST_NV
         }
     },
     
@@ -87,15 +125,15 @@ PREDEFINED_TEMPLATES = {
         "default": {
             "nat_gateway": True,
             "availability_zones": 2,
-            "region": "US East (N. Virginia)"
+            "region": _US_EAST_NV
         }
     },
     
     "load_balancer": {
         "default": {
-            "type": "Application Load Balancer",
-            "scheme": "Internet-facing",
-            "region": "US East (N. Virginia)"
+            "type": _ALB,
+            "scheme": _INTERNET_FACING,
+            "region": _US_EAST_NV
         }
     }
 }
@@ -109,27 +147,24 @@ INFRASTRUCTURE_TEMPLATES = {
             "ec2": {
                 "instance_type": "t3.medium",
                 "quantity": 2,
-                "operating_system": "Linux",
-                "storage_type": "gp3",
+                "operating_system": _LINUX,
+                "storage_type": _GP3,
                 "storage_size": "20",
-                "storage_unit": "GB"
+                "storage_unit": _GB
             },
             "rds": {
-                "engine": "MySQL",
+                "engine": _MYSQL,
                 "instance_class": "db.t3.small",
-                "deployment": "Single-AZ",
+                "deployment": _SINGLE_AZ,
                 "storage_amount": "50",
-                "storage_unit": "GB"
+                "storage_unit": _GB
             },
             "s3": {
                 "storage_amount": 100,
-                "storage_unit": "GB",
-                "storage_class": "Standard"
+                "storage_unit": _GB,
+                "storage_class": _STANDARD
             },
-            "load_balancer": {
-                "type": "Application Load Balancer",
-                "scheme": "Internet-facing"
-            }
+            "load_balancer": _INTERNET_FACING_ALB
         }
     },
     
@@ -143,60 +178,70 @@ INFRASTRUCTURE_TEMPLATES = {
             "ec2": {
                 "instance_type": "r5.large", 
                 "quantity": 4,
-                "operating_system": "Linux",
-                "storage_type": "gp3",
+                "operating_system": _LINUX,
+                "storage_type": _GP3,
                 "storage_size": "100",
-                "storage_unit": "GB"
+                "storage_unit": _GB
             },
             "rds": {
                 "engine": "PostgreSQL",
                 "instance_class": "db.r5.xlarge",
                 "deployment": "Multi-AZ",
                 "storage_amount": "500",
-                "storage_unit": "GB"
+                "storage_unit": _GB
             },
             "s3": {
                 "storage_amount": 1000,
-                "storage_unit": "GB",
-                "storage_class": "Standard"
+                "storage_unit": _GB,
+                "storage_class": _STANDARD
             },
-            "load_balancer": {
-                "type": "Application Load Balancer",
-                "scheme": "Internet-facing"
-            }
+            "load_balancer": _INTERNET_FACING_ALB
         }
     }
 }
 
+# Templates là reference data chỉ đọc - share read-only mappings thay vì copy mỗi lần lookup
+PREDEFINED_TEMPLATES = _freeze(PREDEFINED_TEMPLATES)
+INFRASTRUCTURE_TEMPLATES = _freeze(INFRASTRUCTURE_TEMPLATES)
+_EMPTY_TEMPLATE = _FrozenMapping({})
+
+# Template names không đổi trong suốt runtime - tính sẵn một lần
+_SERVICE_TEMPLATE_NAMES = {service_type: tuple(templates) for service_type, templates in PREDEFINED_TEMPLATES.items()}
+_INFRA_TEMPLATE_NAMES = tuple(INFRASTRUCTURE_TEMPLATES)
+
 
-def get_service_template(service_type: str, template_name: str) -> Dict[str, Any]:
+def _get_template_view(service_type: str, template_name: str) -> Mapping[str, Any]:
+    """Read-only service template (fallback về "default")"""
+    service_templates = PREDEFINED_TEMPLATES.get(service_type)
+    if not service_templates:
+        return _EMPTY_TEMPLATE
+    
+    template = service_templates.get(template_name)
+    if template is None:
+        # Fallback to default template
+        template = service_templates.get("default", _EMPTY_TEMPLATE)
+    
+    return template
+
+
+def get_service_template(service_type: str, template_name: str, copy: bool = False) -> Mapping[str, Any]:
     """
     Lấy template configuration cho một service cụ thể
     
     Args:
         service_type: Loại service (ec2, rds, s3, vpc, load_balancer)
         template_name: Tên template (default, web_server, postgresql, etc.)
+        copy: True để nhận dict có thể sửa thay vì read-only view
         
     Returns:
-        Dict chứa configuration của template
+        Read-only mapping chứa configuration của template (dict nếu copy=True)
     """
-    if service_type not in PREDEFINED_TEMPLATES:
-        return {}
-    
-    service_templates = PREDEFINED_TEMPLATES[service_type]
-    
-    if template_name not in service_templates:
-        # Fallback to default template
-        template_name = "default"
-    
-    if template_name not in service_templates:
-        return {}
+    view = _get_template_view(service_type, template_name)
     
-    # Return a copy to avoid modifying original template
-    return service_templates[template_name].copy()
+    return dict(view) if copy else view
 
 
-def get_infrastructure_template(template_name: str) -> Dict[str, Any]:
+def get_infrastructure_template(template_name: str) -> Mapping[str, Any]:
     """
     Lấy infrastructure template cho một architecture pattern
     
@@ -204,25 +249,29 @@ def get_infrastructure_template(template_name: str) -> Dict[str, Any]:
         template_name: Tên infrastructure template (basic_web_app, enterprise_app)
         
     Returns:
-        Dict chứa description và services configuration
+        Read-only mapping chứa description và services configuration.
+        Dùng get_infrastructure_template_mutable() nếu cần sửa.
+    """
+    return INFRASTRUCTURE_TEMPLATES.get(template_name, _EMPTY_TEMPLATE)
+
+
+def get_infrastructure_template_mutable(template_name: str) -> Dict[str, Any]:
+    """
+    Lấy bản copy có thể sửa của một infrastructure template
+    
+    Args:
+        template_name: Tên infrastructure template (basic_web_app, enterprise_app)
+        
+    Returns:
+        Dict (deep copy) chứa description và services configuration
     """
     if template_name not in INFRASTRUCTURE_TEMPLATES:
         return {}
     
-    # Return a copy to avoid modifying original template
-    template = INFRASTRUCTURE_TEMPLATES[template_name].copy()
-    
-    # Deep copy the services dict
-    if 'services' in template:
-        template['services'] = {
-            service: config.copy() 
-            for service, config in template['services'].items()
-        }
-    
-    return template
+    return _thaw(INFRASTRUCTURE_TEMPLATES[template_name])
 
 
-def get_available_service_templates(service_type: str) -> list:
+def get_available_service_templates(service_type: str) -> Tuple[str, ...]:
     """
     Lấy danh sách các template có sẵn cho một service type
     
@@ -230,22 +279,19 @@ def get_available_service_templates(service_type: str) -> list:
         service_type: Loại service
         
     Returns:
-        List các template names
+        Tuple các template names
     """
-    if service_type not in PREDEFINED_TEMPLATES:
-        return []
-    
-    return list(PREDEFINED_TEMPLATES[service_type].keys())
+    return _SERVICE_TEMPLATE_NAMES.get(service_type, ())
 
 
-def get_available_infrastructure_templates() -> list:
+def get_available_infrastructure_templates() -> Tuple[str, ...]:
     """
     Lấy danh sách các infrastructure templates có sẵn
     
     Returns:
-        List các infrastructure template names
+        Tuple các infrastructure template names
     """
-    return list(INFRASTRUCTURE_TEMPLATES.keys())
+    return _INFRA_TEMPLATE_NAMES
 
 
 def merge_with_template(service_type: str, user_config: Dict[str, Any], template_name: str = "default") -> Dict[str, Any]:
@@ -260,13 +306,7 @@ def merge_with_template(service_type: str, user_config: Dict[str, Any], template
     Returns:
         Dict chứa merged configuration
     """
-    template = get_service_template(service_type, template_name)
-    
-    if not template:
-        return user_config.copy()
+    template = _get_template_view(service_type, template_name)
     
     # Template làm base, user config override
-    merged = template.copy()
-    merged.update(user_config)
-    
-    return merged 
\ No newline at end of file
+    return {**template, **user_config} if template else dict(user_config) 
\ No newline at end of file
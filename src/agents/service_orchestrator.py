@@ -7,50 +7,271 @@ service-specific tasks to specialized agents using LangGraph patterns.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, TypedDict
+import operator
+import os
+import re
+from functools import lru_cache
+from string import Template
+from typing import TYPE_CHECKING, Annotated, Dict, Any, List, Literal, Optional, Tuple, TypedDict
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, START
-from browser_use import Agent
+
+try:
+    from langgraph.types import Send
+except ImportError:  # langgraph < 0.2
+    from langgraph.constants import Send
 
 from ..services.service_registry import service_registry
 from ..monitoring.logger import start_performance_monitoring, end_performance_monitoring
+from ..monitoring.step_stats import step_stats
 from src.utils.aws_config import get_bedrock_llm
+from src.utils.result_cache import estimate_result_cache, config_cache_key, DEFAULT_TTL_SECONDS
+
+if TYPE_CHECKING:
+    from browser_use import Agent, Browser
 
 logger = logging.getLogger(__name__)
 
+# Single-pass estimate link pattern; the optional "final" group marks the preferred
+# "Final Estimate URL:" line, otherwise the first bare link wins
+_ESTIMATE_LINK_RE = re.compile(
+    r'(?P<final>Final Estimate URL:\s*)?(?P<url>https://calculator\.aws/#/estimate\?id=(?P<id>[a-f0-9]+))',
+    re.IGNORECASE
+)
+
+# The calculator returns one shared link; the UI reads it under each of these keys
+_ESTIMATE_LINK_KEYS = ("ondemand", "savings_plan", "real_link")
+
+# Prompts keep all static guidance first and the per-run values last, so the
+# shared prefix is identical across runs and can be served from the provider's prompt cache
+
+# Workflow-level task prompt, compiled once and filled per plan
+_COMPREHENSIVE_TASK_TEMPLATE = Template("""
+        🎯 AWS COST ESTIMATION - MULTI-SERVICE WORKFLOW
+        
+        WORKFLOW OVERVIEW:
+        1. Navigate to AWS Pricing Calculator
+        2. Add each service sequentially to the same estimate
+        3. Generate final estimate link
+        
+        CRITICAL GUIDELINES:
+        - ALL services must be added to the SAME estimate
+        - After each service, return to /addService page
+        - Verify each service appears in estimate summary
+        - Use exact service names when searching
+        - Wait for pages to load completely
+        
+        You will receive specific instructions for each service as we progress.
+        
+        MISSION: Add $service_count AWS services to a single estimate
+        Services: $service_list
+        Estimated time: $estimated_time seconds
+        """)
+
+# Per-service task prompt
+_SERVICE_TASK_TEMPLATE = Template("""
+            🎯 ADD SERVICE TO AWS CALCULATOR
+            
+            NAVIGATION REQUIREMENTS:
+            1. Ensure you are on https://calculator.aws/#/addService page
+            2. If not, navigate to that page first
+            3. Look for "Find Service" search box
+            
+            CRITICAL SUCCESS CRITERIA:
+            - Service must be added to the SAME estimate as previous services
+            - Must return to /addService page after adding service
+            - Verify service appears in estimate summary
+            - No error messages should be displayed
+            
+            Current Status: Adding $service_name ($service_type) to existing estimate
+            
+            SERVICE-SPECIFIC INSTRUCTIONS:
+            $instructions
+            """)
+
+# Final step prompt - fully static
+_FINALIZATION_TASK = """
+            🔗 FINALIZE AWS COST ESTIMATE
+            
+            MISSION: Generate shareable estimate link
+            
+            STEPS:
+            1. Navigate to estimate summary/review page
+            2. Look for "Share" or "Get estimate link" button
+            3. Generate public shareable link
+            4. Copy the complete estimate URL
+            5. Provide the final estimate URL in format:
+               "Final Estimate URL: https://calculator.aws/#/estimate?id=ACTUAL_ID"
+            
+            CRITICAL: Must provide the actual working estimate URL
+            """
+
+@lru_cache(maxsize=32)
+def _render_comprehensive_task(services: Tuple[str, ...], estimated_time: int) -> str:
+    """Workflow task text; retries with the same plan reuse the rendered string"""
+    return _COMPREHENSIVE_TASK_TEMPLATE.substitute(
+        service_count=len(services),
+        service_list=', '.join(services),
+        estimated_time=estimated_time
+    )
+
+@lru_cache(maxsize=128)
+def _render_service_task(service_name: str, service_type: str, instructions: str) -> str:
+    """Per-service task text (handler instructions are themselves memoized)"""
+    return _SERVICE_TASK_TEMPLATE.substitute(
+        service_name=service_name.upper(),
+        service_type=service_type,
+        instructions=instructions
+    )
+
 class ServiceOrchestrationState(TypedDict):
     """State for service orchestration workflow"""
     services_config: Dict[str, Any]
     workflow_plan: Dict[str, Any]
     current_service_index: int
-    completed_services: List[str]
-    failed_services: List[str]
+    total_services: int  # len(workflow_plan["service_order"]), cached for the router
+    # Nodes return only the services they just finished; reducers append them
+    completed_services: Annotated[List[str], operator.add]
+    failed_services: Annotated[List[str], operator.add]
+    browser: Any  # browser_use Browser owned by run_estimation for this run only
     browser_session: Any
+    vision_enabled: bool
     estimate_links: Dict[str, str]
     error_message: str
 
+def _orchestrator_node(method_name: str):
+    """
+    Graph node that dispatches to the orchestrator passed in the run config
+    
+    Lets one compiled graph be shared by every ServiceOrchestrator instance.
+    """
+    async def node(state: Dict[str, Any], config: RunnableConfig):
+        orchestrator = config["configurable"]["orchestrator"]
+        return await getattr(orchestrator, method_name)(state)
+    
+    node.__name__ = method_name
+    return node
+
+def _merge_links(left: Dict[str, str], right: Dict[str, str]) -> Dict[str, str]:
+    """Reducer for estimate links written by parallel branches"""
+    return {**left, **right}
+
+class ParallelEstimationState(TypedDict):
+    """State for the fan-out workflow (one isolated browser session per service)"""
+    services_config: Dict[str, Any]
+    # Reducers let concurrent branches append without overwriting each other
+    completed_services: Annotated[List[str], operator.add]
+    failed_services: Annotated[List[str], operator.add]
+    estimate_links: Annotated[Dict[str, str], _merge_links]
+    browser: Any  # Shared by the branches of one run_parallel_estimation call
+    error_message: str
+
+class ServiceBranchState(TypedDict):
+    """Payload sent to a single fan-out branch"""
+    service_type: str
+    config: Dict[str, Any]
+    browser: Any
+
 class ServiceOrchestrator:
     """
     Service-oriented orchestrator using LangGraph patterns
     
     This orchestrator delegates service-specific tasks to specialized handlers
     and manages the overall workflow using LangGraph state management.
+    
+    vision_mode controls screenshots sent to the LLM: "off" never, "on"
+    every step, "auto" (default) DOM-only first and a single retry with
+    vision when a service fails.
     """
     
-    def __init__(self):
+    def __init__(self, vision_mode: Literal["off", "auto", "on"] = "auto"):
+        if vision_mode not in ("off", "auto", "on"):
+            raise ValueError(f"Invalid vision_mode: {vision_mode}")
+        
+        self.vision_mode = vision_mode
         self.llm = get_bedrock_llm(temperature=0.1)
-        self.workflow = self._build_workflow()
+        self.workflow = self._get_compiled_workflow()
+        self.parallel_workflow = self._get_compiled_parallel_workflow()
         logger.info("🎭 ServiceOrchestrator initialized with modular architecture")
     
-    def _build_workflow(self) -> StateGraph:
+    @staticmethod
+    def _new_browser() -> "Browser":
+        """
+        Create the browser for one run (Chromium starts on first use)
+        
+        Each run_estimation / run_parallel_estimation call owns its browser and
+        closes it before returning, so no Chromium process or event-loop-bound
+        connection outlives the call.
+        """
+        from browser_use import Browser, BrowserConfig
+        
+        headless = os.getenv("HEADLESS", "false").lower() == "true"
+        logger.info("🌐 Browser created for run (headless=%s)", headless)
+        return Browser(config=BrowserConfig(headless=headless))
+    
+    @staticmethod
+    async def _close_browser(browser: "Browser"):
+        """Close a run's browser; a failed close must not mask the run result"""
+        try:
+            await browser.close()
+            logger.info("🧹 Browser closed")
+        except Exception as e:
+            logger.warning("⚠️ Failed to close browser: %s", e)
+    
+    def _create_agent(self, task: str, use_vision: bool, browser: "Browser") -> "Agent":
+        """Create a browser_use Agent on the run's browser"""
+        # browser_use is heavy; import it only when a workflow actually runs
+        from browser_use import Agent
+        
+        return Agent(
+            task=task,
+            llm=self.llm,
+            browser=browser,
+            use_vision=use_vision
+        )
+    
+    @staticmethod
+    def _enable_vision(browser_agent: "Agent"):
+        """Switch a running agent to screenshot steps, keeping its context and history"""
+        # Newer browser_use keeps the flag on AgentSettings, older releases on the agent itself
+        settings = getattr(browser_agent, "settings", None)
+        if settings is not None and hasattr(settings, "use_vision"):
+            settings.use_vision = True
+        else:
+            browser_agent.use_vision = True
+    
+    # Compiled graphs are instance-independent (nodes look up the orchestrator in
+    # the run config), so they are built once per process and shared
+    _COMPILED_WORKFLOW = None
+    _COMPILED_PARALLEL_WORKFLOW = None
+    
+    @classmethod
+    def _get_compiled_workflow(cls):
+        if cls._COMPILED_WORKFLOW is None:
+            cls._COMPILED_WORKFLOW = cls._build_workflow()
+        return cls._COMPILED_WORKFLOW
+    
+    @classmethod
+    def _get_compiled_parallel_workflow(cls):
+        if cls._COMPILED_PARALLEL_WORKFLOW is None:
+            cls._COMPILED_PARALLEL_WORKFLOW = cls._build_parallel_workflow()
+        return cls._COMPILED_PARALLEL_WORKFLOW
+    
+    def _run_config(self, **config: Any) -> RunnableConfig:
+        """Run config that routes the shared graph's nodes to this instance"""
+        return {**config, "configurable": {"orchestrator": self}}
+    
+    @classmethod
+    def _build_workflow(cls) -> StateGraph:
         """Build LangGraph workflow for service orchestration"""
         workflow = StateGraph(ServiceOrchestrationState)
         
         # Add workflow nodes
-        workflow.add_node("plan_workflow", self.plan_workflow)
-        workflow.add_node("initialize_browser", self.initialize_browser)
-        workflow.add_node("process_service", self.process_single_service)
-        workflow.add_node("finalize_estimate", self.finalize_estimate)
-        workflow.add_node("handle_error", self.handle_error)
+        workflow.add_node("plan_workflow", _orchestrator_node("plan_workflow"))
+        workflow.add_node("initialize_browser", _orchestrator_node("initialize_browser"))
+        workflow.add_node("process_service", _orchestrator_node("process_single_service"))
+        workflow.add_node("finalize_estimate", _orchestrator_node("finalize_estimate"))
+        workflow.add_node("handle_error", _orchestrator_node("handle_error"))
         
         # Set entry point
         workflow.set_entry_point("plan_workflow")
@@ -62,7 +283,7 @@ class ServiceOrchestrator:
         # Conditional edges for service processing
         workflow.add_conditional_edges(
             "process_service",
-            self._service_router,
+            cls._service_router,
             {
                 "continue": "process_service",
                 "finalize": "finalize_estimate",
@@ -75,75 +296,116 @@ class ServiceOrchestrator:
         
         return workflow.compile()
     
-    def _service_router(self, state: ServiceOrchestrationState) -> str:
+    @classmethod
+    def _build_parallel_workflow(cls) -> StateGraph:
+        """
+        Build the fan-out workflow used by run_parallel_estimation
+        
+        Services added to one shared estimate must go through a single browser
+        session in order, so only the per-service-estimate mode can fan out.
+        """
+        workflow = StateGraph(ParallelEstimationState)
+        
+        workflow.add_node("validate_services", _orchestrator_node("validate_services"))
+        workflow.add_node("process_service_isolated", _orchestrator_node("process_service_isolated"))
+        
+        workflow.add_edge(START, "validate_services")
+        
+        # One Send per service; LangGraph runs the branches concurrently in the same superstep
+        workflow.add_conditional_edges(
+            "validate_services",
+            cls._fan_out_services,
+            ["process_service_isolated", END]
+        )
+        workflow.add_edge("process_service_isolated", END)
+        
+        return workflow.compile()
+    
+    @staticmethod
+    def _fan_out_services(state: ParallelEstimationState):
+        """Route each service to its own branch, or stop on validation errors"""
+        if state.get("error_message"):
+            return END
+        
+        return [
+            Send("process_service_isolated", {"service_type": service_type, "config": config, "browser": state["browser"]})
+            for service_type, config in state["services_config"].items()
+        ]
+    
+    async def validate_services(self, state: ParallelEstimationState) -> Dict[str, Any]:
+        """Validate every service before any browser is launched"""
+        validation_errors = service_registry.validate_many(state["services_config"])
+        if validation_errors:
+            return {"error_message": f"Configuration validation failed: {'; '.join(validation_errors)}"}
+        
+        return {}
+    
+    async def process_service_isolated(self, branch: ServiceBranchState) -> Dict[str, Any]:
+        """Fan-out branch: run one service in its own browser session"""
+        service_type = branch["service_type"]
+        estimate_link = await self._run_single_service(service_type, branch["config"], branch["browser"])
+        
+        if estimate_link:
+            return {"completed_services": [service_type], "estimate_links": {service_type: estimate_link}}
+        
+        return {"failed_services": [service_type]}
+    
+    @staticmethod
+    def _service_router(state: ServiceOrchestrationState) -> str:
         """Router to determine next action in service processing"""
         if state.get("error_message"):
             return "error"
         
-        current_index = state.get("current_service_index", 0)
-        total_services = len(state.get("workflow_plan", {}).get("service_order", []))
-        
-        if current_index >= total_services:
+        if state["current_service_index"] >= state["total_services"]:
             return "finalize"
         
         return "continue"
     
-    async def plan_workflow(self, state: ServiceOrchestrationState) -> ServiceOrchestrationState:
+    async def plan_workflow(self, state: ServiceOrchestrationState) -> Dict[str, Any]:
         """Plan the workflow based on services configuration"""
         try:
             services_config = state["services_config"]
-            service_types = list(services_config.keys())
+            service_types = list(services_config)
             
-            # Generate workflow plan using service registry
-            workflow_plan = service_registry.get_workflow_plan(service_types)
-            
-            # Validate all services
-            validation_errors = []
-            for service_type, config in services_config.items():
-                errors = service_registry.validate_service_config(service_type, config)
-                validation_errors.extend(errors)
+            # Validate all services first - stop at the first invalid one, the run is aborted anyway
+            validation_errors = service_registry.validate_many(services_config, fail_fast=True)
             
             if validation_errors:
-                state["error_message"] = f"Configuration validation failed: {'; '.join(validation_errors)}"
-                return state
+                return {"error_message": f"Configuration validation failed: {'; '.join(validation_errors)}"}
             
-            state["workflow_plan"] = workflow_plan
-            state["current_service_index"] = 0
-            state["completed_services"] = []
-            state["failed_services"] = []
+            # Generate workflow plan using service registry
+            workflow_plan = service_registry.get_workflow_plan(service_types)
             
-            logger.info(f"📋 Workflow planned for {len(service_types)} services")
-            logger.info(f"⏱️ Estimated time: {workflow_plan['total_estimated_time']} seconds")
-            logger.info(f"🎯 Service order: {workflow_plan['service_order']}")
+            logger.info("📋 Workflow planned for %d services", len(service_types))
+            logger.info("⏱️ Estimated time: %s seconds", workflow_plan['total_estimated_time'])
+            logger.info("🎯 Service order: %s", workflow_plan['service_order'])
+            
+            return {
+                "workflow_plan": workflow_plan,
+                "current_service_index": 0,
+                "total_services": len(workflow_plan["service_order"])
+            }
             
         except Exception as e:
-            state["error_message"] = f"Workflow planning failed: {str(e)}"
-            logger.error(f"❌ Workflow planning error: {e}")
-        
-        return state
+            logger.error("❌ Workflow planning error: %s", e)
+            return {"error_message": f"Workflow planning failed: {str(e)}"}
     
-    async def initialize_browser(self, state: ServiceOrchestrationState) -> ServiceOrchestrationState:
+    async def initialize_browser(self, state: ServiceOrchestrationState) -> Dict[str, Any]:
         """Initialize browser session for the workflow"""
         try:
             # Create browser agent with comprehensive task
             task_description = self._build_comprehensive_task(state)
+            use_vision = self.vision_mode == "on"
             
-            browser_agent = Agent(
-                task=task_description,
-                llm=self.llm,
-                use_vision=True
-            )
-            
-            state["browser_session"] = browser_agent
-            logger.info("🌐 Browser session initialized")
+            browser_agent = self._create_agent(task_description, use_vision, state["browser"])
+            logger.info("🌐 Browser session initialized (vision=%s)", use_vision)
+            return {"browser_session": browser_agent, "vision_enabled": use_vision}
             
         except Exception as e:
-            state["error_message"] = f"Browser initialization failed: {str(e)}"
-            logger.error(f"❌ Browser initialization error: {e}")
-        
-        return state
+            logger.error("❌ Browser initialization error: %s", e)
+            return {"error_message": f"Browser initialization failed: {str(e)}"}
     
-    async def process_single_service(self, state: ServiceOrchestrationState) -> ServiceOrchestrationState:
+    async def process_single_service(self, state: ServiceOrchestrationState) -> Dict[str, Any]:
         """Process a single service using its specialized handler"""
         try:
             workflow_plan = state["workflow_plan"]
@@ -151,7 +413,7 @@ class ServiceOrchestrator:
             service_order = workflow_plan["service_order"]
             
             if current_index >= len(service_order):
-                return state  # All services processed
+                return {}  # All services processed
             
             service_type = service_order[current_index]
             service_config = state["services_config"][service_type]
@@ -163,9 +425,10 @@ class ServiceOrchestrator:
             if not handler:
                 raise ValueError(f"No handler found for service: {service_type}")
             
-            logger.info(f"🔄 Processing service {current_index + 1}/{len(service_order)}: {service_type}")
+            logger.info("🔄 Processing service %s/%d: %s", current_index + 1, len(service_order), service_type)
             
             # Execute service-specific workflow
+            update: Dict[str, Any] = {}
             success = await self._execute_service_workflow(
                 state["browser_session"],
                 handler,
@@ -173,213 +436,378 @@ class ServiceOrchestrator:
                 service_type
             )
             
+            if not success and self.vision_mode == "auto" and not state.get("vision_enabled"):
+                # DOM-only navigation may have missed an element - retry once with screenshots on the
+                # same agent, so the services already added stay in its estimate
+                logger.info("👁️ Retrying %s with vision enabled", service_type)
+                self._enable_vision(state["browser_session"])
+                update["vision_enabled"] = True
+                success = await self._execute_service_workflow(
+                    state["browser_session"],
+                    handler,
+                    service_config,
+                    service_type
+                )
+            
             if success:
-                state["completed_services"].append(service_type)
-                logger.info(f"✅ Service {service_type} completed successfully")
+                update["completed_services"] = [service_type]
+                logger.info("✅ Service %s completed successfully", service_type)
                 end_performance_monitoring(operation_id, success=True)
             else:
-                state["failed_services"].append(service_type)
-                logger.warning(f"⚠️ Service {service_type} failed")
+                update["failed_services"] = [service_type]
+                logger.warning("⚠️ Service %s failed", service_type)
                 end_performance_monitoring(operation_id, success=False)
             
             # Move to next service
-            state["current_service_index"] = current_index + 1
+            update["current_service_index"] = current_index + 1
+            return update
             
         except Exception as e:
             error_msg = f"Service processing error: {str(e)}"
-            state["error_message"] = error_msg
-            logger.error(f"❌ {error_msg}")
-        
-        return state
+            logger.error("❌ %s", error_msg)
+            return {"error_message": error_msg}
     
-    async def _execute_service_workflow(self, browser_agent: Agent, handler, config: Dict[str, Any], service_type: str) -> bool:
+    async def _execute_service_workflow(self, browser_agent: "Agent", handler, config: Dict[str, Any], service_type: str) -> bool:
         """Execute workflow for a specific service"""
         try:
-            # Get service-specific instructions
-            instructions = handler.get_service_instructions(config)
+            # The agent already carries the comprehensive task; per-service prompts are only sent by _run_single_service
             timeout = handler.get_timeout_seconds()
             
-            # Create service-specific task
-            service_task = f"""
-            🎯 ADD {handler.get_service_name().upper()} TO AWS CALCULATOR
-            
-            Current Status: Adding service {service_type} to existing estimate
-            
-            NAVIGATION REQUIREMENTS:
-            1. Ensure you are on https://calculator.aws/#/addService page
-            2. If not, navigate to that page first
-            3. Look for "Find Service" search box
+            # Shared-workflow runs cover the service steps only (no finalization), so
+            # they are tracked apart from the isolated runs of _run_single_service
+            stats_key = f"{service_type}:shared"
+            steps_before = self._history_length(browser_agent)
             
-            SERVICE-SPECIFIC INSTRUCTIONS:
-            {instructions}
-            
-            CRITICAL SUCCESS CRITERIA:
-            - Service must be added to the SAME estimate as previous services
-            - Must return to /addService page after adding service
-            - Verify service appears in estimate summary
-            - No error messages should be displayed
-            """
-            
-            # Execute with timeout
-            result = await asyncio.wait_for(
-                browser_agent.run(max_steps=50),
-                timeout=timeout
-            )
+            # Execute with timeout (step budget learned from previous runs of this service)
+            async with asyncio.timeout(timeout):
+                result = await browser_agent.run(max_steps=step_stats.suggest_max_steps(stats_key, default=50))
             
+            # The agent's history spans every service so far - only this run's steps count
+            step_stats.record(stats_key, len(getattr(result, "history", ())) - steps_before)
             return True  # If no exception, consider success
             
         except asyncio.TimeoutError:
-            logger.error(f"❌ Service {service_type} timed out after {timeout} seconds")
+            logger.error("❌ Service %s timed out after %s seconds", service_type, timeout)
             return False
         except Exception as e:
-            logger.error(f"❌ Service {service_type} execution failed: {e}")
+            logger.error("❌ Service %s execution failed: %s", service_type, e)
             return False
     
-    def _build_comprehensive_task(self, state: ServiceOrchestrationState) -> str:
+    @staticmethod
+    def _history_length(browser_agent: "Agent") -> int:
+        """Steps an agent has recorded so far (newer browser_use keeps history on agent.state)"""
+        history = getattr(getattr(browser_agent, "state", browser_agent), "history", None)
+        return len(getattr(history, "history", ()))
+    
+    @staticmethod
+    def _build_comprehensive_task(state: ServiceOrchestrationState) -> str:
         """Build comprehensive task description for the entire workflow"""
         workflow_plan = state["workflow_plan"]
-        services = workflow_plan["service_order"]
-        
-        return f"""
-        🎯 AWS COST ESTIMATION - MULTI-SERVICE WORKFLOW
-        
-        MISSION: Add {len(services)} AWS services to a single estimate
-        Services: {', '.join(services)}
-        Estimated time: {workflow_plan['total_estimated_time']} seconds
-        
-        WORKFLOW OVERVIEW:
-        1. Navigate to AWS Pricing Calculator
-        2. Add each service sequentially to the same estimate
-        3. Generate final estimate link
-        
-        CRITICAL GUIDELINES:
-        - ALL services must be added to the SAME estimate
-        - After each service, return to /addService page
-        - Verify each service appears in estimate summary
-        - Use exact service names when searching
-        - Wait for pages to load completely
-        
-        You will receive specific instructions for each service as we progress.
-        """
+        return _render_comprehensive_task(tuple(workflow_plan["service_order"]), workflow_plan["total_estimated_time"])
     
-    async def finalize_estimate(self, state: ServiceOrchestrationState) -> ServiceOrchestrationState:
+    async def finalize_estimate(self, state: ServiceOrchestrationState) -> Dict[str, Any]:
         """Finalize the estimate and extract links"""
+        update: Dict[str, Any] = {}
         try:
             browser_agent = state["browser_session"]
             
-            # Extract estimate links
-            finalization_task = """
-            🔗 FINALIZE AWS COST ESTIMATE
+            async with asyncio.timeout(60):
+                result = await browser_agent.run(max_steps=20)
             
-            MISSION: Generate shareable estimate link
-            
-            STEPS:
-            1. Navigate to estimate summary/review page
-            2. Look for "Share" or "Get estimate link" button
-            3. Generate public shareable link
-            4. Copy the complete estimate URL
-            5. Provide the final estimate URL in format:
-               "Final Estimate URL: https://calculator.aws/#/estimate?id=ACTUAL_ID"
-            
-            CRITICAL: Must provide the actual working estimate URL
-            """
-            
-            result = await asyncio.wait_for(
-                browser_agent.run(max_steps=20),
-                timeout=60
-            )
-            
-            # Extract estimate link from result
-            estimate_link = self._extract_estimate_link(result)
+            # Extract estimate link from result (str() of agent history can be large - keep it off the event loop)
+            estimate_link = await asyncio.to_thread(self._extract_estimate_link, result)
             
             if estimate_link:
-                state["estimate_links"] = {
-                    "ondemand": estimate_link,
-                    "savings_plan": estimate_link,
-                    "real_link": estimate_link
-                }
+                update["estimate_links"] = dict.fromkeys(_ESTIMATE_LINK_KEYS, estimate_link)
             
-            logger.info(f"✅ Workflow completed: {len(state['completed_services'])} services added")
+            logger.info("✅ Workflow completed: %d services added", len(state['completed_services']))
             
         except Exception as e:
-            state["error_message"] = f"Finalization failed: {str(e)}"
-            logger.error(f"❌ Finalization error: {e}")
+            update["error_message"] = f"Finalization failed: {str(e)}"
+            logger.error("❌ Finalization error: %s", e)
+        
+        return update
+    
+    @staticmethod
+    def _result_text(result) -> str:
+        """
+        Text outputs of a browser_use run (final result + extracted content)
+        
+        str() of the whole AgentHistoryList also walks screenshots and DOM
+        snapshots, so it is only used when the history API is not available.
+        """
+        chunks = []
+        
+        final_result = getattr(result, "final_result", None)
+        if callable(final_result):
+            text = final_result()
+            if text:
+                chunks.append(text)
         
-        return state
+        extracted_content = getattr(result, "extracted_content", None)
+        if callable(extracted_content):
+            chunks.extend(text for text in extracted_content() if text)
+        
+        return "\n".join(chunks) if chunks else str(result)
     
-    def _extract_estimate_link(self, result) -> str:
+    @staticmethod
+    def _extract_estimate_link(result) -> str:
         """Extract estimate link from browser result"""
         try:
-            result_str = str(result)
-            
-            # Look for estimate URL patterns
-            import re
-            patterns = [
-                r'Final Estimate URL:\s*(https://calculator\.aws/#/estimate\?id=([a-f0-9]+))',
-                r'https://calculator\.aws/#/estimate\?id=([a-f0-9]+)'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, result_str, re.IGNORECASE)
-                if matches:
-                    if isinstance(matches[0], tuple):
-                        return matches[0][0]
-                    return f"https://calculator.aws/#/estimate?id={matches[0]}"
+            result_str = ServiceOrchestrator._result_text(result)
+            
+            # One scan: stop at the first "Final Estimate URL:" match, remember the first bare link
+            first_id = None
+            for match in _ESTIMATE_LINK_RE.finditer(result_str):
+                if match.group("final"):
+                    return match.group("url")
+                if first_id is None:
+                    first_id = match.group("id")
+            
+            if first_id is not None:
+                return f"https://calculator.aws/#/estimate?id={first_id}"
             
             return None
             
         except Exception as e:
-            logger.error(f"❌ Link extraction error: {e}")
+            logger.error("❌ Link extraction error: %s", e)
             return None
     
-    async def handle_error(self, state: ServiceOrchestrationState) -> ServiceOrchestrationState:
+    async def handle_error(self, state: ServiceOrchestrationState) -> Dict[str, Any]:
         """Handle workflow errors"""
         error_msg = state.get("error_message", "Unknown error")
-        logger.error(f"❌ Workflow error: {error_msg}")
-        
-        return state
-    
-    async def run_estimation(self, services_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Main method to run service-oriented estimation workflow"""
-        initial_state = ServiceOrchestrationState(
-            services_config=services_config,
-            workflow_plan={},
-            current_service_index=0,
-            completed_services=[],
-            failed_services=[],
-            browser_session=None,
-            estimate_links={},
-            error_message=""
-        )
+        logger.error("❌ Workflow error: %s", error_msg)
+        return {}
+    
+    async def run_estimation(self, services_config: Dict[str, Any],
+                             ttl_seconds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Main method to run service-oriented estimation workflow
+        
+        Fully successful results are cached on disk keyed by the services_config
+        hash, so identical requests within ttl_seconds skip the browser run.
+        Pass ttl_seconds=0 to bypass the cache.
+        """
+        if ttl_seconds is None:
+            ttl_seconds = DEFAULT_TTL_SECONDS
+        
+        service_keys = list(services_config)
+        
+        # Parse numeric fields once up front; validation, rendering and the cache key all reuse it
+        try:
+            services_config = service_registry.coerce_many(services_config)
+        except Exception as e:
+            logger.error("❌ Invalid services configuration: %s", e)
+            return {
+                "status": "error",
+                "error": f"Invalid services configuration: {str(e)}",
+                "services_attempted": service_keys
+            }
+        
+        # The cache is an optimisation only - any failure falls through to a normal run
+        cache_key = None
+        cached_result = None
+        try:
+            cache_key = config_cache_key(services_config)
+            cached_result = estimate_result_cache.get(cache_key, ttl_seconds)
+        except Exception as e:
+            logger.warning("⚠️ Estimate cache lookup failed, running uncached: %s", e)
         
+        if cached_result is not None:
+            logger.info("♻️ Returning cached estimate for %s", service_keys)
+            cached_result["cached"] = True
+            return cached_result
+        
+        browser = None
         try:
-            final_state = await self.workflow.ainvoke(initial_state)
+            browser = self._new_browser()
+            initial_state = ServiceOrchestrationState(
+                services_config=services_config,
+                workflow_plan={},
+                current_service_index=0,
+                total_services=0,
+                completed_services=[],
+                failed_services=[],
+                browser=browser,
+                browser_session=None,
+                vision_enabled=False,
+                estimate_links={},
+                error_message=""
+            )
+            
+            final_state = await self.workflow.ainvoke(initial_state, config=self._run_config())
             
             # Format result
             if final_state.get("error_message"):
                 return {
                     "status": "error",
                     "error": final_state["error_message"],
-                    "services_attempted": list(services_config.keys())
+                    "services_attempted": service_keys
                 }
             
-            return {
+            result = {
                 "status": "success",
                 "services_added": final_state["completed_services"],
                 "services_failed": final_state["failed_services"],
                 "estimate_links": final_state["estimate_links"],
                 "workflow_plan": final_state["workflow_plan"],
                 "summary": {
-                    "total_services": len(services_config),
+                    "total_services": len(service_keys),
                     "successful": len(final_state["completed_services"]),
                     "failed": len(final_state["failed_services"])
                 }
             }
             
+            # Only cache complete runs; a partial estimate should be retried next time
+            if cache_key is not None and ttl_seconds > 0 and result["estimate_links"] and not result["services_failed"]:
+                try:
+                    estimate_result_cache.set(cache_key, result)
+                except Exception as e:
+                    logger.warning("⚠️ Failed to cache estimate result: %s", e)
+            
+            return result
+            
         except Exception as e:
-            logger.error(f"❌ Orchestration error: {e}")
+            logger.error("❌ Orchestration error: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
-                "services_attempted": list(services_config.keys())
+                "services_attempted": service_keys
+            }
+        finally:
+            if browser is not None:
+                await self._close_browser(browser)
+            await step_stats.save()
+    
+    async def run_many_estimations(self, configs: List[Dict[str, Any]],
+                                   max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Run several independent estimations concurrently
+        
+        Browser runs are I/O-bound (LLM calls + page loads), so overlapping
+        them turns the total time into roughly the slowest run. The
+        semaphore caps parallel browsers to stay within Bedrock rate limits.
+        Results are returned in the same order as configs.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _run_one(services_config: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_estimation(services_config)
+        
+        logger.info("🚀 Running %d estimations (max %s concurrent)", len(configs), max_concurrency)
+        return await asyncio.gather(*(_run_one(config) for config in configs))
+    
+    async def _run_single_service(self, service_type: str, config: Dict[str, Any], browser: "Browser",
+                                  default_max_steps: int = 75) -> Optional[str]:
+        """Run one service in its own browser session and return its estimate link"""
+        handler = service_registry.get_handler(service_type)
+        if not handler:
+            logger.error("❌ No handler found for service: %s", service_type)
+            return None
+        
+        task = _render_service_task(
+            handler.get_service_name(), service_type, handler.get_service_instructions(config)
+        ) + _FINALIZATION_TASK
+        
+        max_steps = step_stats.suggest_max_steps(service_type, default=default_max_steps)
+        
+        # "auto" tries DOM-only first and escalates to vision only if that fails
+        vision_attempts = {"off": (False,), "on": (True,), "auto": (False, True)}[self.vision_mode]
+        
+        operation_id = start_performance_monitoring(f"service_{service_type}")
+        
+        for use_vision in vision_attempts:
+            try:
+                browser_agent = self._create_agent(task, use_vision, browser)
+                
+                # Service timeout plus the finalization budget; one stuck service must not hang the batch
+                async with asyncio.timeout(handler.get_timeout_seconds() + 60):
+                    result = await browser_agent.run(max_steps=max_steps)
+            except asyncio.TimeoutError:
+                logger.error("❌ Service %s timed out (vision=%s)", service_type, use_vision)
+                continue
+            except Exception as e:
+                logger.error("❌ Service %s execution failed (vision=%s): %s", service_type, use_vision, e)
+                continue
+            
+            estimate_link = await asyncio.to_thread(self._extract_estimate_link, result)
+            if estimate_link:
+                # Fresh agent per service, so its history length is this service's step count
+                step_stats.record(service_type, len(getattr(result, "history", ())))
+                end_performance_monitoring(operation_id, success=True)
+                return estimate_link
+        
+        end_performance_monitoring(operation_id, success=False)
+        return None
+    
+    async def run_parallel_estimation(self, services_config: Dict[str, Any],
+                                      max_concurrency: int = 4) -> Dict[str, Any]:
+        """
+        Estimate each service in its own concurrent browser session
+        
+        Unlike run_estimation, every service ends up in a separate estimate,
+        so estimate_links maps service type -> link. Services fan out as
+        parallel LangGraph branches on one browser; max_concurrency caps
+        the number of browser sessions running at once.
+        """
+        service_keys = list(services_config)
+        
+        logger.info("🚀 Running %d services in parallel (max %s concurrent)", len(service_keys), max_concurrency)
+        
+        browser = None
+        try:
+            services_config = service_registry.coerce_many(services_config)
+            browser = self._new_browser()
+            initial_state = ParallelEstimationState(
+                services_config=services_config,
+                completed_services=[],
+                failed_services=[],
+                estimate_links={},
+                browser=browser,
+                error_message=""
+            )
+            
+            final_state = await self.parallel_workflow.ainvoke(
+                initial_state,
+                config=self._run_config(max_concurrency=max_concurrency)
+            )
+        except Exception as e:
+            logger.error("❌ Parallel orchestration error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e),
+                "services_attempted": service_keys
+            }
+        finally:
+            if browser is not None:
+                await self._close_browser(browser)
+            # Step counts recorded by the branches are written once per run, off the event loop
+            await step_stats.save()
+        
+        if final_state.get("error_message"):
+            return {
+                "status": "error",
+                "error": final_state["error_message"],
+                "services_attempted": service_keys
+            }
+        
+        # Branches finish in any order - report in request order
+        estimate_links = {
+            service_type: final_state["estimate_links"][service_type]
+            for service_type in service_keys
+            if service_type in final_state["estimate_links"]
+        }
+        services_failed = [service_type for service_type in service_keys if service_type not in estimate_links]
+        
+        return {
+            "status": "success",
+            "services_added": list(estimate_links),
+            "services_failed": services_failed,
+            "estimate_links": estimate_links,
+            "summary": {
+                "total_services": len(service_keys),
+                "successful": len(estimate_links),
+                "failed": len(services_failed)
             }
+        }
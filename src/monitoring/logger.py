@@ -5,16 +5,30 @@ This module provides comprehensive logging, monitoring, and performance tracking
 for the browser automation and workflow execution.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 import time
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from contextvars import ContextVar
+from itertools import chain, count
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-@dataclass
+try:
+    # orjson (C extension) serializes records much faster; optional dependency
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetric:
     """Performance metric data structure"""
     operation: str
@@ -26,9 +40,18 @@ class PerformanceMetric:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat fields - a literal avoids asdict()'s recursive deep copy
+        return {
+            "operation": self.operation,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "success": self.success,
+            "error_message": self.error_message,
+            "metadata": self.metadata
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowEvent:
     """Workflow event data structure"""
     event_type: str
@@ -38,35 +61,109 @@ class WorkflowEvent:
     details: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "service_type": self.service_type,
+            "status": self.status,
+            "details": self.details
+        }
+
+@dataclass
+class _OperationAggregate:
+    """Running totals for one operation, updated as metrics arrive"""
+    count: int = 0
+    success_count: int = 0
+    total_duration: float = 0.0
+    min_duration: float = float("inf")
+    max_duration: float = 0.0
+    
+    def add(self, metric: PerformanceMetric):
+        self.count += 1
+        self.success_count += metric.success
+        self.total_duration += metric.duration
+        self.min_duration = min(self.min_duration, metric.duration)
+        self.max_duration = max(self.max_duration, metric.duration)
+
+@dataclass(slots=True)
+class _InFlight:
+    """Handle for a running operation, passed back to end_operation as-is"""
+    operation: str
+    start_ns: int
+    finished: bool = False
 
 class PerformanceMonitor:
     """Monitors performance metrics for browser automation"""
     
     def __init__(self):
-        self.metrics: List[PerformanceMetric] = []
-        self.active_operations: Dict[str, float] = {}
+        # Metrics bucketed per operation with running aggregates, so stats
+        # polling doesn't rescan every metric recorded so far
+        self._by_operation: Dict[str, List[PerformanceMetric]] = defaultdict(list)
+        self._aggregates: Dict[str, _OperationAggregate] = defaultdict(_OperationAggregate)
+        # Only operations started with string_id=True are tracked here; the default
+        # _InFlight handle carries its own start time, so no lookup is needed.
+        # Ids come from a counter so operations started in the same millisecond can't collide
+        self.active_operations: Dict[str, _InFlight] = {}
+        self._operation_ids = count(1)
+    
+    @property
+    def metrics(self) -> List[PerformanceMetric]:
+        """All recorded metrics (a new list; use clear() to reset)"""
+        return list(self.iter_metrics())
+    
+    def iter_metrics(self) -> Iterator[PerformanceMetric]:
+        """Iterate recorded metrics without copying them into one list"""
+        # Snapshot the buckets so operations added meanwhile don't break iteration
+        return chain.from_iterable(list(self._by_operation.values()))
+    
+    def add_metric(self, metric: PerformanceMetric):
+        """Record a finished metric and update its operation's aggregates"""
+        self._by_operation[metric.operation].append(metric)
+        self._aggregates[metric.operation].add(metric)
     
-    def start_operation(self, operation: str) -> str:
-        """Start timing an operation"""
-        operation_id = f"{operation}_{int(time.time() * 1000)}"
-        self.active_operations[operation_id] = time.time()
+    def clear(self):
+        """Drop all recorded metrics"""
+        self._by_operation.clear()
+        self._aggregates.clear()
+    
+    def start_operation(self, operation: str, string_id: bool = False) -> Union[_InFlight, str]:
+        """
+        Start timing an operation
+        
+        Returns a handle to pass to end_operation. With string_id=True a
+        string id is returned instead (for callers that need to serialize it).
+        """
+        in_flight = _InFlight(operation, time.perf_counter_ns())
+        if not string_id:
+            return in_flight
+        
+        operation_id = f"{operation}_{next(self._operation_ids)}"
+        self.active_operations[operation_id] = in_flight
         return operation_id
     
-    def end_operation(self, operation_id: str, success: bool = True, 
+    def end_operation(self, operation_id: Union[_InFlight, str], success: bool = True, 
                      error_message: Optional[str] = None, 
                      metadata: Optional[Dict[str, Any]] = None):
         """End timing an operation"""
-        if operation_id not in self.active_operations:
-            logging.warning(f"Operation {operation_id} not found in active operations")
+        if isinstance(operation_id, str):
+            in_flight = self.active_operations.pop(operation_id, None)
+        else:
+            in_flight = operation_id
+        
+        if in_flight is None:
+            logging.warning("Operation %s not found in active operations", operation_id)
+            return
+        if in_flight.finished:
+            logging.warning("Operation %s already ended", in_flight.operation)
             return
         
-        start_time = self.active_operations.pop(operation_id)
-        end_time = time.time()
-        duration = end_time - start_time
+        in_flight.finished = True
+        operation = in_flight.operation
+        duration = (time.perf_counter_ns() - in_flight.start_ns) / 1e9
         
-        # Extract operation name from operation_id
-        operation = operation_id.rsplit('_', 1)[0]
+        # Monotonic clock for the duration; wall-clock only for the exported timestamps
+        end_time = time.time()
+        start_time = end_time - duration
         
         metric = PerformanceMetric(
             operation=operation,
@@ -78,48 +175,45 @@ class PerformanceMonitor:
             metadata=metadata
         )
         
-        self.metrics.append(metric)
+        self.add_metric(metric)
         
-        # Log the metric
-        status = "✅" if success else "❌"
-        logging.info(f"{status} {operation} completed in {duration:.2f}s")
+        # Log the metric (skip building the line entirely when INFO is disabled)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            status = "✅" if success else "❌"
+            logging.info("%s %s completed in %.2fs", status, operation, duration)
         
         if not success and error_message:
-            logging.error(f"❌ {operation} failed: {error_message}")
+            logging.error("❌ %s failed: %s", operation, error_message)
     
     def get_operation_stats(self, operation: str) -> Dict[str, Any]:
         """Get statistics for a specific operation"""
-        operation_metrics = [m for m in self.metrics if m.operation == operation]
+        aggregate = self._aggregates.get(operation)
         
-        if not operation_metrics:
+        if aggregate is None:
             return {"operation": operation, "count": 0}
         
-        durations = [m.duration for m in operation_metrics]
-        successes = [m for m in operation_metrics if m.success]
-        
         return {
             "operation": operation,
-            "count": len(operation_metrics),
-            "success_count": len(successes),
-            "success_rate": len(successes) / len(operation_metrics),
-            "avg_duration": sum(durations) / len(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "total_duration": sum(durations)
+            "count": aggregate.count,
+            "success_count": aggregate.success_count,
+            "success_rate": aggregate.success_count / aggregate.count,
+            "avg_duration": aggregate.total_duration / aggregate.count,
+            "min_duration": aggregate.min_duration,
+            "max_duration": aggregate.max_duration,
+            "total_duration": aggregate.total_duration
         }
     
     def get_overall_stats(self) -> Dict[str, Any]:
         """Get overall performance statistics"""
-        if not self.metrics:
+        if not self._aggregates:
             return {"total_operations": 0}
         
-        total_operations = len(self.metrics)
-        successful_operations = len([m for m in self.metrics if m.success])
-        total_duration = sum(m.duration for m in self.metrics)
+        aggregates = self._aggregates.values()
+        total_operations = sum(aggregate.count for aggregate in aggregates)
+        successful_operations = sum(aggregate.success_count for aggregate in aggregates)
+        total_duration = sum(aggregate.total_duration for aggregate in aggregates)
         
-        # Get unique operations
-        unique_operations = list(set(m.operation for m in self.metrics))
-        operation_stats = {op: self.get_operation_stats(op) for op in unique_operations}
+        operation_stats = {op: self.get_operation_stats(op) for op in self._aggregates}
         
         return {
             "total_operations": total_operations,
@@ -127,10 +221,14 @@ class PerformanceMonitor:
             "success_rate": successful_operations / total_operations,
             "total_duration": total_duration,
             "avg_duration": total_duration / total_operations,
-            "unique_operations": len(unique_operations),
+            "unique_operations": len(operation_stats),
             "operation_breakdown": operation_stats
         }
 
+# Service event log line, emoji by event status
+_STATUS_EMOJI = {"started": "🔄", "completed": "✅", "failed": "❌"}
+_SERVICE_EVENT_LOG = "%s %s %s: %s"
+
 class WorkflowMonitor:
     """Monitors workflow execution and events"""
     
@@ -138,20 +236,47 @@ class WorkflowMonitor:
         self.events: List[WorkflowEvent] = []
         self.current_workflow: Optional[str] = None
         self.workflow_start_time: Optional[float] = None
+        # Running counts so get_workflow_summary doesn't rescan the event history
+        self._workflow_event_count = 0
+        self._service_event_count = 0
+        self._service_stats: Dict[str, Dict[str, int]] = {}
+    
+    def _record_event(self, event: WorkflowEvent):
+        """Append an event and update the running counts"""
+        self.events.append(event)
+        
+        if event.event_type in ("workflow_start", "workflow_end"):
+            self._workflow_event_count += 1
+        
+        if event.service_type is not None:
+            self._service_event_count += 1
+            counts = self._service_stats.get(event.service_type)
+            if counts is None:
+                counts = self._service_stats[event.service_type] = {"started": 0, "completed": 0, "failed": 0}
+            if event.status in counts:
+                counts[event.status] += 1
+    
+    def clear(self):
+        """Drop recorded events and their counts"""
+        self.events.clear()
+        self._workflow_event_count = 0
+        self._service_event_count = 0
+        self._service_stats.clear()
     
     def start_workflow(self, workflow_name: str):
         """Start monitoring a workflow"""
+        now = time.time()
         self.current_workflow = workflow_name
-        self.workflow_start_time = time.time()
+        self.workflow_start_time = now
         
         event = WorkflowEvent(
             event_type="workflow_start",
-            timestamp=time.time(),
+            timestamp=now,
             status="started",
             details={"workflow_name": workflow_name}
         )
-        self.events.append(event)
-        logging.info(f"🚀 Workflow started: {workflow_name}")
+        self._record_event(event)
+        logging.info("🚀 Workflow started: %s", workflow_name)
     
     def end_workflow(self, success: bool = True, error_message: Optional[str] = None):
         """End workflow monitoring"""
@@ -159,11 +284,12 @@ class WorkflowMonitor:
             logging.warning("No active workflow to end")
             return
         
-        duration = time.time() - self.workflow_start_time if self.workflow_start_time else 0
+        now = time.time()
+        duration = now - self.workflow_start_time if self.workflow_start_time else 0
         
         event = WorkflowEvent(
             event_type="workflow_end",
-            timestamp=time.time(),
+            timestamp=now,
             status="completed" if success else "failed",
             details={
                 "workflow_name": self.current_workflow,
@@ -171,10 +297,10 @@ class WorkflowMonitor:
                 "error_message": error_message
             }
         )
-        self.events.append(event)
+        self._record_event(event)
         
         status = "✅" if success else "❌"
-        logging.info(f"{status} Workflow completed: {self.current_workflow} ({duration:.2f}s)")
+        logging.info("%s Workflow completed: %s (%.2fs)", status, self.current_workflow, duration)
         
         self.current_workflow = None
         self.workflow_start_time = None
@@ -189,44 +315,50 @@ class WorkflowMonitor:
             status=status,
             details=details
         )
-        self.events.append(event)
+        self._record_event(event)
         
-        status_emoji = {"started": "🔄", "completed": "✅", "failed": "❌"}.get(status, "ℹ️")
-        logging.info(f"{status_emoji} {service_type} {event_type}: {status}")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(_SERVICE_EVENT_LOG, _STATUS_EMOJI.get(status, "ℹ️"), service_type, event_type, status)
     
     def get_workflow_summary(self) -> Dict[str, Any]:
         """Get summary of workflow execution"""
         if not self.events:
             return {"total_events": 0}
         
-        workflow_events = [e for e in self.events if e.event_type in ["workflow_start", "workflow_end"]]
-        service_events = [e for e in self.events if e.service_type is not None]
-        
-        # Count service events by type and status
-        service_stats = {}
-        for event in service_events:
-            service = event.service_type
-            if service not in service_stats:
-                service_stats[service] = {"started": 0, "completed": 0, "failed": 0}
-            
-            if event.status in service_stats[service]:
-                service_stats[service][event.status] += 1
-        
         return {
             "total_events": len(self.events),
-            "workflow_events": len(workflow_events),
-            "service_events": len(service_events),
-            "service_breakdown": service_stats,
+            "workflow_events": self._workflow_event_count,
+            "service_events": self._service_event_count,
+            "service_breakdown": {service: dict(counts) for service, counts in self._service_stats.items()},
             "current_workflow": self.current_workflow
         }
 
 class EnhancedLogger:
     """Enhanced logger with structured logging and monitoring integration"""
     
+    # One live instance per logger name (see get)
+    _instances: "WeakValueDictionary[str, EnhancedLogger]" = WeakValueDictionary()
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, name: str, log_file: Optional[str] = None) -> "EnhancedLogger":
+        """
+        Get the shared EnhancedLogger for name, creating it on first use
+        
+        log_file only applies when the instance is created.
+        """
+        with cls._instances_lock:
+            instance = cls._instances.get(name)
+            if instance is None:
+                instance = cls(name, log_file)
+                cls._instances[name] = instance
+            return instance
+    
     def __init__(self, name: str, log_file: Optional[str] = None):
         self.logger = logging.getLogger(name)
         self.performance_monitor = PerformanceMonitor()
         self.workflow_monitor = WorkflowMonitor()
+        self._listener: Optional[logging.handlers.QueueListener] = None
         
         # Configure logger
         if not self.logger.handlers:
@@ -241,16 +373,30 @@ class EnhancedLogger:
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # File handler if specified
         if log_file:
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # Log calls only enqueue the record; a background thread does the
+        # console/disk writes so coroutines never block on I/O
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.close)
         
         self.logger.setLevel(logging.INFO)
     
+    def close(self):
+        """Flush queued log records and stop the background writer thread"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
     def log_with_performance(self, level: int, message: str, operation: Optional[str] = None,
                            duration: Optional[float] = None, success: bool = True,
                            metadata: Optional[Dict[str, Any]] = None):
@@ -267,7 +413,7 @@ class EnhancedLogger:
                 success=success,
                 metadata=metadata
             )
-            self.performance_monitor.metrics.append(metric)
+            self.performance_monitor.add_metric(metric)
     
     def info(self, message: str, **kwargs):
         """Log info message"""
@@ -304,22 +450,71 @@ class EnhancedLogger:
         except Exception as e:
             self.error(f"Failed to export metrics: {str(e)}")
 
+    def export_metrics_ndjson(self, file_path: str):
+        """
+        Export metrics and events as NDJSON (one record per line)
+        
+        Records are serialized and written one at a time, so memory stays flat
+        no matter how many metrics were collected.
+        """
+        try:
+            with open(file_path, 'wb') as f:
+                for record_type, records in (("metric", self.performance_monitor.iter_metrics()),
+                                             ("event", list(self.workflow_monitor.events))):
+                    for record in records:
+                        f.write(_dump_json_line({"record_type": record_type, **record.to_dict()}))
+            
+            self.info(f"Metrics exported to {file_path}")
+            
+        except Exception as e:
+            self.error(f"Failed to export metrics: {str(e)}")
+    
+    async def export_metrics_ndjson_async(self, file_path: str):
+        """export_metrics_ndjson without blocking the event loop"""
+        await asyncio.to_thread(self.export_metrics_ndjson, file_path)
+
+def _dump_json_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one NDJSON line (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+
 # Global logger instance
-enhanced_logger = EnhancedLogger("aws_cost_estimation_agent")
+enhanced_logger = EnhancedLogger.get("aws_cost_estimation_agent")
 
 # Convenience functions
 def get_logger() -> EnhancedLogger:
     """Get the global enhanced logger instance"""
     return enhanced_logger
 
-def start_performance_monitoring(operation: str) -> str:
+# Operations started in the current context, innermost last. Each asyncio task
+# works on its own copy, so concurrent services never share bookkeeping state.
+_operation_stack: ContextVar[Tuple[_InFlight, ...]] = ContextVar("_operation_stack", default=())
+
+def start_performance_monitoring(operation: str) -> _InFlight:
     """Start monitoring performance for an operation"""
-    return enhanced_logger.performance_monitor.start_operation(operation)
+    in_flight = enhanced_logger.performance_monitor.start_operation(operation)
+    _operation_stack.set(_operation_stack.get() + (in_flight,))
+    return in_flight
 
-def end_performance_monitoring(operation_id: str, success: bool = True, 
+def end_performance_monitoring(operation_id: Optional[Union[_InFlight, str]] = None, success: bool = True, 
                              error_message: Optional[str] = None,
                              metadata: Optional[Dict[str, Any]] = None):
-    """End performance monitoring for an operation"""
+    """
+    End performance monitoring for an operation
+    
+    Without operation_id, ends the innermost operation started in this context.
+    """
+    stack = _operation_stack.get()
+    if operation_id is None:
+        if not stack:
+            logging.warning("No operation in progress in this context")
+            return
+        operation_id = stack[-1]
+    
+    if any(in_flight is operation_id for in_flight in stack):
+        _operation_stack.set(tuple(in_flight for in_flight in stack if in_flight is not operation_id))
+    
     enhanced_logger.performance_monitor.end_operation(
         operation_id, success, error_message, metadata
     )
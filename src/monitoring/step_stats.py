@@ -0,0 +1,100 @@
+"""
+Agent Step Statistics
+Lưu số steps thực tế của browser agent theo service type để tính max_steps
+thay vì dùng hằng số cố định cho mọi service
+"""
+
+import os
+import json
+import math
+import asyncio
+import logging
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Số samples gần nhất giữ lại cho mỗi service
+MAX_SAMPLES = 50
+
+# Cần ít nhất chừng này samples mới dùng số liệu thay cho default
+MIN_SAMPLES = 3
+
+# max_steps tối thiểu để agent còn đủ chỗ xử lý page chậm / popup
+MIN_STEPS = 10
+
+
+class StepStats:
+    """Rolling step counts per service type, persisted as JSON"""
+
+    def __init__(self, stats_path: Optional[str] = None):
+        self.stats_path = Path(
+            stats_path or os.getenv("AGENT_STATS_PATH", "~/.aws_agent_stats.json")
+        ).expanduser()
+        self._samples: Dict[str, List[int]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List[int]]:
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # File hỏng hoặc sai format (không phải dict, steps không phải số) thì bỏ qua
+            return {
+                service_type: [int(steps) for steps in samples][-MAX_SAMPLES:]
+                for service_type, samples in data.items()
+                if isinstance(samples, list)
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("⚠️ Unreadable step stats %s: %s", self.stats_path, e)
+            return {}
+
+    def _write(self, payload: str):
+        """Ghi file atomic (tmp file riêng cho mỗi lần ghi); chạy trong worker thread"""
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.stats_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            logger.warning("⚠️ Failed to write step stats: %s", e)
+
+    def record(self, service_type: str, steps: int):
+        """Ghi nhận số steps của một lần chạy thành công (chỉ trong memory, gọi save() để lưu)"""
+        if steps <= 0:
+            return
+
+        samples = self._samples.setdefault(service_type, [])
+        samples.append(steps)
+        del samples[:-MAX_SAMPLES]
+        self._dirty = True
+
+    async def save(self):
+        """Lưu samples xuống disk nếu có thay đổi, không block event loop"""
+        if not self._dirty:
+            return
+
+        # Snapshot trên event loop, chỉ phần ghi file chạy trong thread
+        payload = json.dumps(self._samples)
+        self._dirty = False
+        await asyncio.to_thread(self._write, payload)
+
+    def suggest_max_steps(self, service_type: str, default: int) -> int:
+        """
+        max_steps = mean + 2 * stdev của các lần chạy gần đây
+
+        Trả về default khi chưa đủ history; không bao giờ vượt quá default
+        """
+        samples = self._samples.get(service_type, [])
+        if len(samples) < MIN_SAMPLES:
+            return default
+
+        budget = statistics.fmean(samples) + 2 * statistics.pstdev(samples)
+        return max(MIN_STEPS, min(default, math.ceil(budget)))
+
+# Global stats instance
+step_stats = StepStats()
@@ -3,14 +3,82 @@ AWS Services Module - Service-Oriented Architecture
 
 This module contains all AWS service handlers and the service registry.
 Import this module to automatically register all available services.
+
+Handler modules are only imported when one of their services is first
+looked up in the registry (or the submodule is accessed as an attribute),
+so importing the package does not pay for services a run never uses.
 """
 
+import importlib
+from functools import partial
+
 from .service_registry import service_registry, BaseServiceHandler
-from . import compute_services
-from . import ai_ml_services
-from . import database_services
-from . import storage_services
-from . import networking_services
+
+# service_type -> (submodule that registers it, category)
+_SERVICE_MODULES = {
+    "ec2": ("compute_services", "compute"),
+    "lambda": ("compute_services", "compute"),
+    "sagemaker": ("compute_services", "ml"),
+    "bedrock": ("ai_ml_services", "ml"),
+    "comprehend": ("ai_ml_services", "ml"),
+    "rekognition": ("ai_ml_services", "ml"),
+    "textract": ("ai_ml_services", "ml"),
+    "rds": ("database_services", "database"),
+    "dynamodb": ("database_services", "database"),
+    "s3": ("storage_services", "storage"),
+    "ebs": ("storage_services", "storage"),
+    "vpc": ("networking_services", "networking"),
+    "cloudfront": ("networking_services", "networking"),
+    "load_balancer": ("networking_services", "networking"),
+}
+
+_SUBMODULES = (
+    "compute_services",
+    "ai_ml_services",
+    "database_services",
+    "storage_services",
+    "networking_services",
+)
+
+# Handler singletons re-exported from their (lazily imported) submodules
+_HANDLER_EXPORTS = {
+    "EC2_HANDLER": "compute_services",
+    "LAMBDA_HANDLER": "compute_services",
+    "SAGEMAKER_HANDLER": "compute_services",
+    "BEDROCK_HANDLER": "ai_ml_services",
+    "COMPREHEND_HANDLER": "ai_ml_services",
+    "REKOGNITION_HANDLER": "ai_ml_services",
+    "TEXTRACT_HANDLER": "ai_ml_services",
+}
+
+def __getattr__(name: str):
+    """Import handler submodules on first attribute access (PEP 562)"""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    if name in _HANDLER_EXPORTS:
+        handler = getattr(__getattr__(_HANDLER_EXPORTS[name]), name)
+        globals()[name] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _load_handler(service_type: str, module_name: str) -> BaseServiceHandler:
+    """
+    Lazy factory: importing the submodule registers all of its handlers
+    
+    Raises instead of returning None, so the registry keeps this factory and a
+    failed import (or a module that doesn't register the type) can be retried.
+    """
+    __getattr__(module_name)
+    handler = service_registry.get_handler(service_type)
+    if handler is None:
+        raise LookupError(f"{module_name} did not register service {service_type!r}")
+    return handler
+
+for _service_type, (_module_name, _category) in _SERVICE_MODULES.items():
+    service_registry.register_lazy(_service_type, partial(_load_handler, _service_type, _module_name), _category)
+del _service_type, _module_name, _category
 
 __all__ = [
     'service_registry',
@@ -19,5 +87,6 @@ __all__ = [
     'ai_ml_services',
     'database_services',
     'storage_services',
-    'networking_services'
+    'networking_services',
+    *_HANDLER_EXPORTS
 ]
@@ -5,61 +5,18 @@ This module contains handlers for AWS AI/ML services following the
 service-oriented architecture pattern.
 """
 
-from typing import Dict, Any, List
-from .service_registry import BaseServiceHandler, service_registry
+import sys
+from types import MappingProxyType
+from .service_registry import SpecServiceHandler, add_to_estimate_step, service_registry
 import logging
 
 logger = logging.getLogger(__name__)
 
-class BedrockServiceHandler(BaseServiceHandler):
-    """Handler for Amazon Bedrock service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon Bedrock"
-    
-    def get_search_terms(self) -> List[str]:
-        return ["Bedrock", "Amazon Bedrock", "Foundation Models"]
-    
-    def get_service_category(self) -> str:
-        return "ml"
-    
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "model": "Claude 3 Sonnet",
-            "input_tokens": "1000000",
-            "output_tokens": "100000",
-            "region": "US East (N. Virginia)",
-            "pricing_model": "On-Demand"
-        }
-    
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        if not config.get("model"):
-            errors.append("Bedrock: model is required")
-        
-        input_tokens = config.get("input_tokens", "1000000")
-        try:
-            tokens_val = int(input_tokens)
-            if tokens_val < 1:
-                errors.append("Bedrock: input_tokens must be positive")
-        except (ValueError, TypeError):
-            errors.append("Bedrock: input_tokens must be a valid number")
-        
-        output_tokens = config.get("output_tokens", "100000")
-        try:
-            tokens_val = int(output_tokens)
-            if tokens_val < 1:
-                errors.append("Bedrock: output_tokens must be positive")
-        except (ValueError, TypeError):
-            errors.append("Bedrock: output_tokens must be a valid number")
-        
-        return errors
-    
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+# Common default values, interned so every handler and module shares one string object
+_US_EAST_NV = sys.intern("US East (N. Virginia)")
+_ON_DEMAND = sys.intern("On-Demand")
+
+_BEDROCK_INSTRUCTIONS = """
         ADD AMAZON BEDROCK SERVICE:
 
         Step 1: Service Selection
@@ -70,61 +27,42 @@ class BedrockServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure Bedrock with these settings:
-        - Region: {full_config['region']}
-        - Model: {full_config['model']}
-        - Input Tokens: {full_config['input_tokens']}
-        - Output Tokens: {full_config['output_tokens']}
-        - Pricing Model: {full_config['pricing_model']}
+        - Region: {region}
+        - Model: {model}
+        - Input Tokens: {input_tokens}
+        - Output Tokens: {output_tokens}
+        - Pricing Model: {pricing_model}
 
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Bedrock appears in estimate summary
-        """
-    
-    def get_timeout_seconds(self) -> int:
-        return 120  # AI services can have complex pricing models
-    
-    def get_complexity_score(self) -> int:
-        return 7  # High complexity due to model selection
+""" + add_to_estimate_step("Bedrock")
 
-class ComprehendServiceHandler(BaseServiceHandler):
-    """Handler for Amazon Comprehend service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon Comprehend"
-    
-    def get_search_terms(self) -> List[str]:
-        return ["Comprehend", "Amazon Comprehend", "Natural Language Processing"]
-    
-    def get_service_category(self) -> str:
-        return "ml"
-    
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "characters_per_month": "1000000",
-            "api_requests": "10000",
-            "region": "US East (N. Virginia)",
-            "analysis_type": "Sentiment Analysis"
-        }
-    
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        characters = config.get("characters_per_month", "1000000")
-        try:
-            char_val = int(characters)
-            if char_val < 1:
-                errors.append("Comprehend: characters_per_month must be positive")
-        except (ValueError, TypeError):
-            errors.append("Comprehend: characters_per_month must be a valid number")
-        
-        return errors
+class BedrockServiceHandler(SpecServiceHandler):
+    """Handler for Amazon Bedrock service"""
     
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "model": "Claude 3 Sonnet",
+        "input_tokens": "1000000",
+        "output_tokens": "100000",
+        "region": _US_EAST_NV,
+        "pricing_model": _ON_DEMAND
+    })
+    
+    _SERVICE_NAME = "Amazon Bedrock"
+    _SEARCH_TERMS = ("Bedrock", "Amazon Bedrock", "Foundation Models")
+    _CATEGORY = "ml"
+    _INSTRUCTIONS = _BEDROCK_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 120  # AI services can have complex pricing models
+    _COMPLEXITY_SCORE = 7  # High complexity due to model selection
+    
+    _LABEL = "Bedrock"
+    _REQUIRED_FIELDS = ("model",)
+    _INT_RANGES = (
+        ("input_tokens", 1, None, "must be positive"),
+        ("output_tokens", 1, None, "must be positive"),
+    )
+
+_COMPREHEND_INSTRUCTIONS = """
         📝 ADD AMAZON COMPREHEND SERVICE:
 
         Step 1: Service Selection
@@ -135,59 +73,36 @@ class ComprehendServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure Comprehend with these settings:
-        - Region: {full_config['region']}
-        - Analysis Type: {full_config['analysis_type']}
-        - Characters per month: {full_config['characters_per_month']}
-        - API Requests: {full_config['api_requests']}
+        - Region: {region}
+        - Analysis Type: {analysis_type}
+        - Characters per month: {characters_per_month}
+        - API Requests: {api_requests}
 
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Comprehend appears in estimate summary
-        """
-    
-    def get_timeout_seconds(self) -> int:
-        return 100
-    
-    def get_complexity_score(self) -> int:
-        return 5  # Medium complexity
+""" + add_to_estimate_step("Comprehend")
 
-class RekognitionServiceHandler(BaseServiceHandler):
-    """Handler for Amazon Rekognition service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon Rekognition"
-    
-    def get_search_terms(self) -> List[str]:
-        return ["Rekognition", "Amazon Rekognition", "Image Analysis"]
+class ComprehendServiceHandler(SpecServiceHandler):
+    """Handler for Amazon Comprehend service"""
     
-    def get_service_category(self) -> str:
-        return "ml"
+    __slots__ = ()
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "images_per_month": "10000",
-            "analysis_type": "Object Detection",
-            "region": "US East (N. Virginia)"
-        }
+    _DEFAULT_CONFIG = MappingProxyType({
+        "characters_per_month": "1000000",
+        "api_requests": "10000",
+        "region": _US_EAST_NV,
+        "analysis_type": "Sentiment Analysis"
+    })
     
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        images = config.get("images_per_month", "10000")
-        try:
-            img_val = int(images)
-            if img_val < 1:
-                errors.append("Rekognition: images_per_month must be positive")
-        except (ValueError, TypeError):
-            errors.append("Rekognition: images_per_month must be a valid number")
-        
-        return errors
+    _SERVICE_NAME = "Amazon Comprehend"
+    _SEARCH_TERMS = ("Comprehend", "Amazon Comprehend", "Natural Language Processing")
+    _CATEGORY = "ml"
+    _INSTRUCTIONS = _COMPREHEND_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 100
+    _COMPLEXITY_SCORE = 5  # Medium complexity
     
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+    _LABEL = "Comprehend"
+    _INT_RANGES = (("characters_per_month", 1, None, "must be positive"),)
+
+_REKOGNITION_INSTRUCTIONS = """
         👁️ ADD AMAZON REKOGNITION SERVICE:
 
         Step 1: Service Selection
@@ -198,58 +113,34 @@ class RekognitionServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure Rekognition with these settings:
-        - Region: {full_config['region']}
-        - Analysis Type: {full_config['analysis_type']}
-        - Images per month: {full_config['images_per_month']}
+        - Region: {region}
+        - Analysis Type: {analysis_type}
+        - Images per month: {images_per_month}
 
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Rekognition appears in estimate summary
-        """
-    
-    def get_timeout_seconds(self) -> int:
-        return 100
-    
-    def get_complexity_score(self) -> int:
-        return 5  # Medium complexity
+""" + add_to_estimate_step("Rekognition")
 
-class TextractServiceHandler(BaseServiceHandler):
-    """Handler for Amazon Textract service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon Textract"
-    
-    def get_search_terms(self) -> List[str]:
-        return ["Textract", "Amazon Textract", "Document Analysis"]
+class RekognitionServiceHandler(SpecServiceHandler):
+    """Handler for Amazon Rekognition service"""
     
-    def get_service_category(self) -> str:
-        return "ml"
+    __slots__ = ()
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "pages_per_month": "1000",
-            "analysis_type": "Text Detection",
-            "region": "US East (N. Virginia)"
-        }
+    _DEFAULT_CONFIG = MappingProxyType({
+        "images_per_month": "10000",
+        "analysis_type": "Object Detection",
+        "region": _US_EAST_NV
+    })
     
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        pages = config.get("pages_per_month", "1000")
-        try:
-            page_val = int(pages)
-            if page_val < 1:
-                errors.append("Textract: pages_per_month must be positive")
-        except (ValueError, TypeError):
-            errors.append("Textract: pages_per_month must be a valid number")
-        
-        return errors
+    _SERVICE_NAME = "Amazon Rekognition"
+    _SEARCH_TERMS = ("Rekognition", "Amazon Rekognition", "Image Analysis")
+    _CATEGORY = "ml"
+    _INSTRUCTIONS = _REKOGNITION_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 100
+    _COMPLEXITY_SCORE = 5  # Medium complexity
     
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+    _LABEL = "Rekognition"
+    _INT_RANGES = (("images_per_month", 1, None, "must be positive"),)
+
+_TEXTRACT_INSTRUCTIONS = """
         📄 ADD AMAZON TEXTRACT SERVICE:
 
         Step 1: Service Selection
@@ -260,26 +151,52 @@ class TextractServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure Textract with these settings:
-        - Region: {full_config['region']}
-        - Analysis Type: {full_config['analysis_type']}
-        - Pages per month: {full_config['pages_per_month']}
+        - Region: {region}
+        - Analysis Type: {analysis_type}
+        - Pages per month: {pages_per_month}
 
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Textract appears in estimate summary
-        """
-    
-    def get_timeout_seconds(self) -> int:
-        return 100
-    
-    def get_complexity_score(self) -> int:
-        return 5  # Medium complexity
+""" + add_to_estimate_step("Textract")
 
-# Register all AI/ML services
-service_registry.register_service("bedrock", BedrockServiceHandler())
-service_registry.register_service("comprehend", ComprehendServiceHandler())
-service_registry.register_service("rekognition", RekognitionServiceHandler())
-service_registry.register_service("textract", TextractServiceHandler())
+class TextractServiceHandler(SpecServiceHandler):
+    """Handler for Amazon Textract service"""
+    
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "pages_per_month": "1000",
+        "analysis_type": "Text Detection",
+        "region": _US_EAST_NV
+    })
+    
+    _SERVICE_NAME = "Amazon Textract"
+    _SEARCH_TERMS = ("Textract", "Amazon Textract", "Document Analysis")
+    _CATEGORY = "ml"
+    _INSTRUCTIONS = _TEXTRACT_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 100
+    _COMPLEXITY_SCORE = 5  # Medium complexity
+    
+    _LABEL = "Textract"
+    _INT_RANGES = (("pages_per_month", 1, None, "must be positive"),)
+
+# Handler singletons by module attribute: (service type, handler class, category)
+_HANDLERS = {
+    "BEDROCK_HANDLER": ("bedrock", BedrockServiceHandler, "ml"),
+    "COMPREHEND_HANDLER": ("comprehend", ComprehendServiceHandler, "ml"),
+    "REKOGNITION_HANDLER": ("rekognition", RekognitionServiceHandler, "ml"),
+    "TEXTRACT_HANDLER": ("textract", TextractServiceHandler, "ml"),
+}
+
+def __getattr__(name: str):
+    """Resolve *_HANDLER singletons through the registry on first access (PEP 562)"""
+    if name in _HANDLERS:
+        handler = service_registry.get_handler(_HANDLERS[name][0])
+        globals()[name] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Register all AI/ML services - each handler is only created on first lookup
+for _service_type, _handler_class, _category in _HANDLERS.values():
+    service_registry.register_lazy(_service_type, _handler_class, _category)
+del _service_type, _handler_class, _category
 
 logger.info("✅ AI/ML services registered: Bedrock, Comprehend, Rekognition, Textract")
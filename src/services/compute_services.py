@@ -5,100 +5,23 @@ This module contains handlers for AWS compute services following the
 service-oriented architecture pattern.
 """
 
+import sys
+from types import MappingProxyType
 from typing import Dict, Any, List
-from .service_registry import BaseServiceHandler, service_registry
+from .service_registry import SpecServiceHandler, add_to_estimate_step, parse_int, service_registry
 import logging
 
 logger = logging.getLogger(__name__)
 
-class EC2ServiceHandler(BaseServiceHandler):
-    """Handler for Amazon EC2 service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon EC2"
-    
-    def get_search_terms(self) -> List[str]:
-        return ["EC2", "Amazon EC2", "Elastic Compute Cloud"]
-    
-    def get_service_category(self) -> str:
-        return "compute"
-    
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "instance_type": "t4g.nano",  # Updated to match instructions
-            "quantity": 1,
-            "operating_system": "Linux",
-            "region": "US East (Ohio)",  # Updated to match instructions
-            "storage_type": "General Purpose SSD (gp3)",  # Full name as in AWS Calculator
-            "storage_size": "30",  # Updated to match instructions
-            "storage_unit": "GB",
-            "tenancy": "Shared",
-            "pricing_model": "On-Demand",
-            "utilization": "100",  # Added utilization percentage
-            "workload_pattern": "Constant usage",  # Added workload pattern
-            "iops": "3000",  # Added IOPS configuration
-            "description": "EC2 Instance Estimate"  # Added description
-        }
-    
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-
-        # Required fields validation
-        if not config.get("instance_type"):
-            errors.append("EC2: instance_type is required")
-
-        if not config.get("operating_system"):
-            errors.append("EC2: operating_system is required")
-
-        if not config.get("region"):
-            errors.append("EC2: region is required")
-
-        # Quantity validation
-        quantity = config.get("quantity", 1)
-        try:
-            qty_val = int(quantity)
-            if qty_val < 1 or qty_val > 1000:
-                errors.append("EC2: quantity must be between 1 and 1000")
-        except (ValueError, TypeError):
-            errors.append("EC2: quantity must be a valid number")
-
-        # Storage size validation
-        storage_size = config.get("storage_size", "30")
-        try:
-            size = int(storage_size)
-            if size < 8:
-                errors.append("EC2: storage_size must be at least 8 GB")
-            if size > 16384:  # 16 TB limit for most EBS volumes
-                errors.append("EC2: storage_size cannot exceed 16,384 GB")
-        except (ValueError, TypeError):
-            errors.append("EC2: storage_size must be a valid number")
-
-        # Utilization validation
-        utilization = config.get("utilization", "100")
-        try:
-            util_val = int(utilization)
-            if util_val < 1 or util_val > 100:
-                errors.append("EC2: utilization must be between 1 and 100 percent")
-        except (ValueError, TypeError):
-            errors.append("EC2: utilization must be a valid number")
-
-        # IOPS validation (if provided)
-        iops = config.get("iops")
-        if iops:
-            try:
-                iops_val = int(iops)
-                if iops_val < 100 or iops_val > 64000:
-                    errors.append("EC2: IOPS must be between 100 and 64,000")
-            except (ValueError, TypeError):
-                errors.append("EC2: IOPS must be a valid number")
+# Common default values, interned so every handler and module shares one string object
+_US_EAST_NV = sys.intern("US East (N. Virginia)")
+_ON_DEMAND = sys.intern("On-Demand")
+_LINUX = sys.intern("Linux")
+_SHARED = sys.intern("Shared")
+_GP3_SSD = sys.intern("General Purpose SSD (gp3)")
+_GB = sys.intern("GB")
 
-        return errors
-    
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        # Merge with defaults
-        full_config = {**self.get_default_config(), **config}
-
-        return f"""
+_EC2_INSTRUCTIONS = """
         🖥️ AMAZON EC2 DETAILED CONFIGURATION WORKFLOW
 
         PHASE 1: INITIAL SETUP AND NAVIGATION
@@ -129,17 +52,17 @@ class EC2ServiceHandler(BaseServiceHandler):
         Step 5: Select Region
         - Find region dropdown or selection area
         - Click on region dropdown
-        - Select: "{full_config['region']}"
+        - Select: "{region}"
         - Verify region is selected correctly
 
         Step 6: Configure Tenancy
         - Look for tenancy options (Shared Instances, Dedicated, etc.)
-        - Select radio button for: "{full_config['tenancy']}"
+        - Select radio button for: "{tenancy}"
         - Verify selection is highlighted/checked
 
         Step 7: Select Operating System
         - Find operating system selection area
-        - Select radio button for: "{full_config['operating_system']}"
+        - Select radio button for: "{operating_system}"
         - Verify OS selection is highlighted/checked
 
         PHASE 3: WORKLOAD AND INSTANCE CONFIGURATION
@@ -152,20 +75,20 @@ class EC2ServiceHandler(BaseServiceHandler):
         Step 9: Set Number of Instances
         - Find instances number input field
         - Clear existing value
-        - Enter: "{full_config['quantity']}"
+        - Enter: "{quantity}"
         - Verify number is entered correctly
 
         Step 10: Select Instance Type
         - Look for instance type selection area or table
-        - Find and click on: "{full_config['instance_type']}"
+        - Find and click on: "{instance_type}"
         - Wait 1 second for selection to register
-        - Verify "{full_config['instance_type']}" is selected/highlighted
+        - Verify "{instance_type}" is selected/highlighted
 
         PHASE 4: PAYMENT OPTIONS CONFIGURATION
 
         Step 11: Configure Payment Method
         - Find payment method options
-        - Select "{full_config['pricing_model']}" option
+        - Select "{pricing_model}" option
         - Verify payment method is selected
 
         Step 12: Set Expected Utilization
@@ -182,13 +105,13 @@ class EC2ServiceHandler(BaseServiceHandler):
 
         Step 14: Select Storage Type
         - Find storage type dropdown
-        - Select: "{full_config['storage_type']}" or "General Purpose SSD (gp3)"
+        - Select: "{storage_type}" or "General Purpose SSD (gp3)"
         - Verify storage type is selected
 
         Step 15: Set Storage Amount
         - Find storage amount input field (may have GB placeholder)
         - Clear existing value
-        - Enter: "{full_config['storage_size']}"
+        - Enter: "{storage_size}"
         - Verify storage amount is entered
 
         Step 16: Configure IOPS (if available)
@@ -217,68 +140,68 @@ class EC2ServiceHandler(BaseServiceHandler):
         - Must return to main calculator page or show success confirmation
 
         CONFIGURATION SUMMARY:
-        - Region: {full_config['region']}
-        - OS: {full_config['operating_system']}
-        - Instance Type: {full_config['instance_type']}
-        - Quantity: {full_config['quantity']}
-        - Tenancy: {full_config['tenancy']}
-        - Pricing: {full_config['pricing_model']}
-        - Storage: {full_config['storage_size']} {full_config['storage_unit']} {full_config['storage_type']}
+        - Region: {region}
+        - OS: {operating_system}
+        - Instance Type: {instance_type}
+        - Quantity: {quantity}
+        - Tenancy: {tenancy}
+        - Pricing: {pricing_model}
+        - Storage: {storage_size} {storage_unit} {storage_type}
         """
-    
-    def get_timeout_seconds(self) -> int:
-        return 180  # EC2 has detailed multi-phase configuration
-
-    def get_complexity_score(self) -> int:
-        return 8  # High complexity due to detailed phase-based workflow
 
-class LambdaServiceHandler(BaseServiceHandler):
-    """Handler for AWS Lambda service"""
+class EC2ServiceHandler(SpecServiceHandler):
+    """Handler for Amazon EC2 service"""
     
-    def get_service_name(self) -> str:
-        return "AWS Lambda"
+    __slots__ = ()
     
-    def get_search_terms(self) -> List[str]:
-        return ["Lambda", "AWS Lambda", "Serverless"]
+    _DEFAULT_CONFIG = MappingProxyType({
+        "instance_type": "t4g.nano",  # Updated to match instructions
+        "quantity": 1,
+        "operating_system": _LINUX,
+        "region": "US East (Ohio)",  # Updated to match instructions
+        "storage_type": _GP3_SSD,  # Full name as in AWS Calculator
+        "storage_size": "30",  # Updated to match instructions
+        "storage_unit": _GB,
+        "tenancy": _SHARED,
+        "pricing_model": _ON_DEMAND,
+        "utilization": "100",  # Added utilization percentage
+        "workload_pattern": "Constant usage",  # Added workload pattern
+        "iops": "3000",  # Added IOPS configuration
+        "description": "EC2 Instance Estimate"  # Added description
+    })
     
-    def get_service_category(self) -> str:
-        return "compute"
+    _SERVICE_NAME = "Amazon EC2"
+    _SEARCH_TERMS = ("EC2", "Amazon EC2", "Elastic Compute Cloud")
+    _CATEGORY = "compute"
+    _INSTRUCTIONS = _EC2_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 180  # EC2 has detailed multi-phase configuration
+    _COMPLEXITY_SCORE = 8  # High complexity due to detailed phase-based workflow
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "memory": "512",
-            "memory_unit": "MB",
-            "requests_per_month": "1000000",
-            "duration_per_request": "100",
-            "duration_unit": "ms",
-            "region": "US East (N. Virginia)"
-        }
+    _LABEL = "EC2"
+    _REQUIRED_FIELDS = ("instance_type", "operating_system", "region")
+    _INT_RANGES = (
+        ("quantity", 1, 1000, "must be between 1 and 1000"),
+        # 16 TB limit for most EBS volumes
+        ("storage_size", 8, 16384, ("must be at least 8 GB", "cannot exceed 16,384 GB")),
+        ("utilization", 1, 100, "must be between 1 and 100 percent"),
+    )
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        memory = config.get("memory", "512")
-        try:
-            mem_val = int(memory)
-            if mem_val < 128 or mem_val > 10240:
-                errors.append("Lambda: memory must be between 128 MB and 10,240 MB")
-        except (ValueError, TypeError):
-            errors.append("Lambda: memory must be a valid number")
+        errors = super().validate_config(config)
         
-        requests = config.get("requests_per_month", "1000000")
-        try:
-            req_val = int(requests)
-            if req_val < 0:
-                errors.append("Lambda: requests_per_month must be non-negative")
-        except (ValueError, TypeError):
-            errors.append("Lambda: requests_per_month must be a valid number")
+        # IOPS is optional, so it is only checked when provided (and left out of
+        # _INT_FIELDS: a falsy 0 is skipped while "0" is checked)
+        iops = config.get("iops")
+        if iops:
+            iops_val = parse_int(iops)
+            if iops_val is None:
+                errors.append("EC2: IOPS must be a valid number")
+            elif iops_val < 100 or iops_val > 64000:
+                errors.append("EC2: IOPS must be between 100 and 64,000")
         
         return errors
-    
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+
+_LAMBDA_INSTRUCTIONS = """
         ⚡ ADD AWS LAMBDA SERVICE:
 
         Step 1: Service Selection
@@ -289,65 +212,41 @@ class LambdaServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure Lambda with these settings:
-        - Region: {full_config['region']}
-        - Memory: {full_config['memory']} {full_config['memory_unit']}
-        - Requests per month: {full_config['requests_per_month']}
-        - Duration per request: {full_config['duration_per_request']} {full_config['duration_unit']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Lambda appears in estimate summary
-        """
-    
-    def get_timeout_seconds(self) -> int:
-        return 90  # Lambda is simpler to configure
-    
-    def get_complexity_score(self) -> int:
-        return 4  # Medium complexity
+        - Region: {region}
+        - Memory: {memory} {memory_unit}
+        - Requests per month: {requests_per_month}
+        - Duration per request: {duration_per_request} {duration_unit}
 
-class SageMakerServiceHandler(BaseServiceHandler):
-    """Handler for Amazon SageMaker service"""
-    
-    def get_service_name(self) -> str:
-        return "Amazon SageMaker"
+""" + add_to_estimate_step("Lambda")
+
+class LambdaServiceHandler(SpecServiceHandler):
+    """Handler for AWS Lambda service"""
     
-    def get_search_terms(self) -> List[str]:
-        return ["SageMaker", "Amazon SageMaker", "Machine Learning"]
+    __slots__ = ()
     
-    def get_service_category(self) -> str:
-        return "ml"
+    _DEFAULT_CONFIG = MappingProxyType({
+        "memory": "512",
+        "memory_unit": "MB",
+        "requests_per_month": "1000000",
+        "duration_per_request": "100",
+        "duration_unit": "ms",
+        "region": _US_EAST_NV
+    })
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "instance_type": "ml.t3.medium",
-            "instance_hours": "100",
-            "storage_size": "20",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)",
-            "workload_type": "Training"
-        }
+    _SERVICE_NAME = "AWS Lambda"
+    _SEARCH_TERMS = ("Lambda", "AWS Lambda", "Serverless")
+    _CATEGORY = "compute"
+    _INSTRUCTIONS = _LAMBDA_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 90  # Lambda is simpler to configure
+    _COMPLEXITY_SCORE = 4  # Medium complexity
     
-    def validate_config(self, config: Dict[str, Any]) -> List[str]:
-        errors = []
-        
-        if not config.get("instance_type"):
-            errors.append("SageMaker: instance_type is required")
-        
-        hours = config.get("instance_hours", "100")
-        try:
-            hours_val = int(hours)
-            if hours_val < 1:
-                errors.append("SageMaker: instance_hours must be positive")
-        except (ValueError, TypeError):
-            errors.append("SageMaker: instance_hours must be a valid number")
-        
-        return errors
-    
-    def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
+    _LABEL = "Lambda"
+    _INT_RANGES = (
+        ("memory", 128, 10240, "must be between 128 MB and 10,240 MB"),
+        ("requests_per_month", 0, None, "must be non-negative"),
+    )
+
+_SAGEMAKER_INSTRUCTIONS = """
         🤖 ADD AMAZON SAGEMAKER SERVICE:
 
         Step 1: Service Selection
@@ -358,27 +257,57 @@ class SageMakerServiceHandler(BaseServiceHandler):
 
         Step 2: Configuration
         Configure SageMaker with these settings:
-        - Region: {full_config['region']}
-        - Workload Type: {full_config['workload_type']}
-        - Instance Type: {full_config['instance_type']}
-        - Instance Hours: {full_config['instance_hours']}
-        - Storage: {full_config['storage_size']} {full_config['storage_unit']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm SageMaker appears in estimate summary
-        """
+        - Region: {region}
+        - Workload Type: {workload_type}
+        - Instance Type: {instance_type}
+        - Instance Hours: {instance_hours}
+        - Storage: {storage_size} {storage_unit}
+
+""" + add_to_estimate_step("SageMaker")
+
+class SageMakerServiceHandler(SpecServiceHandler):
+    """Handler for Amazon SageMaker service"""
     
-    def get_timeout_seconds(self) -> int:
-        return 150  # ML services can be complex
+    __slots__ = ()
     
-    def get_complexity_score(self) -> int:
-        return 8  # High complexity due to ML-specific options
-
-# Register all compute services
-service_registry.register_service("ec2", EC2ServiceHandler())
-service_registry.register_service("lambda", LambdaServiceHandler())
-service_registry.register_service("sagemaker", SageMakerServiceHandler())
+    _DEFAULT_CONFIG = MappingProxyType({
+        "instance_type": "ml.t3.medium",
+        "instance_hours": "100",
+        "storage_size": "20",
+        "storage_unit": _GB,
+        "region": _US_EAST_NV,
+        "workload_type": "Training"
+    })
+    
+    _SERVICE_NAME = "Amazon SageMaker"
+    _SEARCH_TERMS = ("SageMaker", "Amazon SageMaker", "Machine Learning")
+    _CATEGORY = "ml"
+    _INSTRUCTIONS = _SAGEMAKER_INSTRUCTIONS
+    _TIMEOUT_SECONDS = 150  # ML services can be complex
+    _COMPLEXITY_SCORE = 8  # High complexity due to ML-specific options
+    
+    _LABEL = "SageMaker"
+    _REQUIRED_FIELDS = ("instance_type",)
+    _INT_RANGES = (("instance_hours", 1, None, "must be positive"),)
+
+# Handler singletons by module attribute: (service type, handler class, category)
+_HANDLERS = {
+    "EC2_HANDLER": ("ec2", EC2ServiceHandler, "compute"),
+    "LAMBDA_HANDLER": ("lambda", LambdaServiceHandler, "compute"),
+    "SAGEMAKER_HANDLER": ("sagemaker", SageMakerServiceHandler, "ml"),
+}
+
+def __getattr__(name: str):
+    """Resolve *_HANDLER singletons through the registry on first access (PEP 562)"""
+    if name in _HANDLERS:
+        handler = service_registry.get_handler(_HANDLERS[name][0])
+        globals()[name] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Register all compute services - each handler is only created on first lookup
+for _service_type, _handler_class, _category in _HANDLERS.values():
+    service_registry.register_lazy(_service_type, _handler_class, _category)
+del _service_type, _handler_class, _category
 
 logger.info("✅ Compute services registered: EC2, Lambda, SageMaker")
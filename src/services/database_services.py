@@ -5,34 +5,59 @@ This module contains handlers for AWS database services following the
 service-oriented architecture pattern.
 """
 
-from typing import Dict, Any, List
-from .service_registry import BaseServiceHandler, service_registry
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Sequence
+from .service_registry import BaseServiceHandler, add_to_estimate_step, service_registry
 import logging
 
 logger = logging.getLogger(__name__)
 
+_RDS_INSTRUCTIONS = """
+        🗄️ ADD AMAZON RDS SERVICE:
+
+        Step 1: Service Selection
+        - Search for "RDS" in the service search box
+        - Look for "Amazon RDS" service card (Managed Relational Database)
+        - Click "Configure" button on the Amazon RDS service card
+        - Verify URL contains "rds" after page loads
+
+        Step 2: Configuration
+        Configure RDS with these settings:
+        - Region: {region}
+        - Database Engine: {engine}
+        - Instance Class: {instance_class}
+        - Storage Type: {storage_type}
+        - Allocated Storage: {allocated_storage} {storage_unit}
+        - Multi-AZ: {multi_az}
+
+""" + add_to_estimate_step("RDS")
+
 class RDSServiceHandler(BaseServiceHandler):
     """Handler for Amazon RDS service"""
     
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "engine": "MySQL",
+        "instance_class": "db.t3.micro",
+        "storage_type": "gp2",
+        "allocated_storage": "20",
+        "storage_unit": "GB",
+        "multi_az": "No",
+        "region": "US East (N. Virginia)"
+    })
+    
     def get_service_name(self) -> str:
         return "Amazon RDS"
     
-    def get_search_terms(self) -> List[str]:
-        return ["RDS", "Amazon RDS", "Relational Database"]
+    def get_search_terms(self) -> Sequence[str]:
+        return ("RDS", "Amazon RDS", "Relational Database")
     
     def get_service_category(self) -> str:
         return "database"
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "engine": "MySQL",
-            "instance_class": "db.t3.micro",
-            "storage_type": "gp2",
-            "allocated_storage": "20",
-            "storage_unit": "GB",
-            "multi_az": "No",
-            "region": "US East (N. Virginia)"
-        }
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         errors = []
@@ -54,31 +79,7 @@ class RDSServiceHandler(BaseServiceHandler):
         return errors
     
     def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
-        🗄️ ADD AMAZON RDS SERVICE:
-
-        Step 1: Service Selection
-        - Search for "RDS" in the service search box
-        - Look for "Amazon RDS" service card (Managed Relational Database)
-        - Click "Configure" button on the Amazon RDS service card
-        - Verify URL contains "rds" after page loads
-
-        Step 2: Configuration
-        Configure RDS with these settings:
-        - Region: {full_config['region']}
-        - Database Engine: {full_config['engine']}
-        - Instance Class: {full_config['instance_class']}
-        - Storage Type: {full_config['storage_type']}
-        - Allocated Storage: {full_config['allocated_storage']} {full_config['storage_unit']}
-        - Multi-AZ: {full_config['multi_az']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm RDS appears in estimate summary
-        """
+        return self.render_instructions(_RDS_INSTRUCTIONS, config)
     
     def get_timeout_seconds(self) -> int:
         return 140  # Database services can be complex
@@ -86,26 +87,48 @@ class RDSServiceHandler(BaseServiceHandler):
     def get_complexity_score(self) -> int:
         return 7  # High complexity due to many database options
 
+_DYNAMODB_INSTRUCTIONS = """
+        📊 ADD AMAZON DYNAMODB SERVICE:
+
+        Step 1: Service Selection
+        - Search for "DynamoDB" in the service search box
+        - Look for "Amazon DynamoDB" service card (NoSQL Database)
+        - Click "Configure" button on the Amazon DynamoDB service card
+        - Verify URL contains "dynamodb" after page loads
+
+        Step 2: Configuration
+        Configure DynamoDB with these settings:
+        - Region: {region}
+        - Read Capacity Units: {read_capacity}
+        - Write Capacity Units: {write_capacity}
+        - Data Storage: {storage_size} {storage_unit}
+
+""" + add_to_estimate_step("DynamoDB")
+
 class DynamoDBServiceHandler(BaseServiceHandler):
     """Handler for Amazon DynamoDB service"""
     
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "read_capacity": "5",
+        "write_capacity": "5",
+        "storage_size": "1",
+        "storage_unit": "GB",
+        "region": "US East (N. Virginia)"
+    })
+    
     def get_service_name(self) -> str:
         return "Amazon DynamoDB"
     
-    def get_search_terms(self) -> List[str]:
-        return ["DynamoDB", "Amazon DynamoDB", "NoSQL"]
+    def get_search_terms(self) -> Sequence[str]:
+        return ("DynamoDB", "Amazon DynamoDB", "NoSQL")
     
     def get_service_category(self) -> str:
         return "database"
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "read_capacity": "5",
-            "write_capacity": "5",
-            "storage_size": "1",
-            "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
-        }
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         errors = []
@@ -129,29 +152,7 @@ class DynamoDBServiceHandler(BaseServiceHandler):
         return errors
     
     def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
-        📊 ADD AMAZON DYNAMODB SERVICE:
-
-        Step 1: Service Selection
-        - Search for "DynamoDB" in the service search box
-        - Look for "Amazon DynamoDB" service card (NoSQL Database)
-        - Click "Configure" button on the Amazon DynamoDB service card
-        - Verify URL contains "dynamodb" after page loads
-
-        Step 2: Configuration
-        Configure DynamoDB with these settings:
-        - Region: {full_config['region']}
-        - Read Capacity Units: {full_config['read_capacity']}
-        - Write Capacity Units: {full_config['write_capacity']}
-        - Data Storage: {full_config['storage_size']} {full_config['storage_unit']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm DynamoDB appears in estimate summary
-        """
+        return self.render_instructions(_DYNAMODB_INSTRUCTIONS, config)
     
     def get_timeout_seconds(self) -> int:
         return 120
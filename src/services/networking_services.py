@@ -5,32 +5,55 @@ This module contains handlers for AWS networking services following the
 service-oriented architecture pattern.
 """
 
-from typing import Dict, Any, List
-from .service_registry import BaseServiceHandler, service_registry
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Sequence
+from .service_registry import BaseServiceHandler, add_to_estimate_step, service_registry
 import logging
 
 logger = logging.getLogger(__name__)
 
+_VPC_INSTRUCTIONS = """
+        🌐 ADD AMAZON VPC SERVICE:
+
+        Step 1: Service Selection
+        - Search for "VPC" in the service search box
+        - Look for "Amazon VPC" service card (Virtual Private Cloud)
+        - Click "Configure" button on the Amazon VPC service card
+        - Verify URL contains "vpc" after page loads
+
+        Step 2: Configuration
+        Configure VPC with these settings:
+        - Region: {region}
+        - NAT Gateways: {nat_gateways}
+        - VPN Connections: {vpn_connections}
+        - Data Transfer: {data_transfer} {data_transfer_unit}
+
+""" + add_to_estimate_step("VPC")
+
 class VPCServiceHandler(BaseServiceHandler):
     """Handler for Amazon VPC service"""
     
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "nat_gateways": "1",
+        "vpn_connections": "0",
+        "data_transfer": "10",
+        "data_transfer_unit": "GB",
+        "region": "US East (N. Virginia)"
+    })
+    
     def get_service_name(self) -> str:
         return "Amazon VPC"
     
-    def get_search_terms(self) -> List[str]:
-        return ["VPC", "Amazon VPC", "Virtual Private Cloud"]
+    def get_search_terms(self) -> Sequence[str]:
+        return ("VPC", "Amazon VPC", "Virtual Private Cloud")
     
     def get_service_category(self) -> str:
         return "networking"
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "nat_gateways": "1",
-            "vpn_connections": "0",
-            "data_transfer": "10",
-            "data_transfer_unit": "GB",
-            "region": "US East (N. Virginia)"
-        }
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         errors = []
@@ -46,29 +69,7 @@ class VPCServiceHandler(BaseServiceHandler):
         return errors
     
     def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
-        🌐 ADD AMAZON VPC SERVICE:
-
-        Step 1: Service Selection
-        - Search for "VPC" in the service search box
-        - Look for "Amazon VPC" service card (Virtual Private Cloud)
-        - Click "Configure" button on the Amazon VPC service card
-        - Verify URL contains "vpc" after page loads
-
-        Step 2: Configuration
-        Configure VPC with these settings:
-        - Region: {full_config['region']}
-        - NAT Gateways: {full_config['nat_gateways']}
-        - VPN Connections: {full_config['vpn_connections']}
-        - Data Transfer: {full_config['data_transfer']} {full_config['data_transfer_unit']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm VPC appears in estimate summary
-        """
+        return self.render_instructions(_VPC_INSTRUCTIONS, config)
     
     def get_timeout_seconds(self) -> int:
         return 100
@@ -76,26 +77,48 @@ class VPCServiceHandler(BaseServiceHandler):
     def get_complexity_score(self) -> int:
         return 4  # Medium complexity
 
+_CLOUDFRONT_INSTRUCTIONS = """
+        🌍 ADD AMAZON CLOUDFRONT SERVICE:
+
+        Step 1: Service Selection
+        - Search for "CloudFront" in the service search box
+        - Look for "Amazon CloudFront" service card (Content Delivery Network)
+        - Click "Configure" button on the Amazon CloudFront service card
+        - Verify URL contains "cloudfront" after page loads
+
+        Step 2: Configuration
+        Configure CloudFront with these settings:
+        - Region: {region}
+        - Data Transfer Out: {data_transfer} {data_transfer_unit}
+        - HTTP/HTTPS Requests: {requests}
+        - Origin Requests: {origin_requests}
+
+""" + add_to_estimate_step("CloudFront")
+
 class CloudFrontServiceHandler(BaseServiceHandler):
     """Handler for Amazon CloudFront service"""
     
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "data_transfer": "100",
+        "data_transfer_unit": "GB",
+        "requests": "1000000",
+        "origin_requests": "100000",
+        "region": "US East (N. Virginia)"
+    })
+    
     def get_service_name(self) -> str:
         return "Amazon CloudFront"
     
-    def get_search_terms(self) -> List[str]:
-        return ["CloudFront", "Amazon CloudFront", "CDN"]
+    def get_search_terms(self) -> Sequence[str]:
+        return ("CloudFront", "Amazon CloudFront", "CDN")
     
     def get_service_category(self) -> str:
         return "networking"
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "data_transfer": "100",
-            "data_transfer_unit": "GB",
-            "requests": "1000000",
-            "origin_requests": "100000",
-            "region": "US East (N. Virginia)"
-        }
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         errors = []
@@ -111,29 +134,7 @@ class CloudFrontServiceHandler(BaseServiceHandler):
         return errors
     
     def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
-        🌍 ADD AMAZON CLOUDFRONT SERVICE:
-
-        Step 1: Service Selection
-        - Search for "CloudFront" in the service search box
-        - Look for "Amazon CloudFront" service card (Content Delivery Network)
-        - Click "Configure" button on the Amazon CloudFront service card
-        - Verify URL contains "cloudfront" after page loads
-
-        Step 2: Configuration
-        Configure CloudFront with these settings:
-        - Region: {full_config['region']}
-        - Data Transfer Out: {full_config['data_transfer']} {full_config['data_transfer_unit']}
-        - HTTP/HTTPS Requests: {full_config['requests']}
-        - Origin Requests: {full_config['origin_requests']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm CloudFront appears in estimate summary
-        """
+        return self.render_instructions(_CLOUDFRONT_INSTRUCTIONS, config)
     
     def get_timeout_seconds(self) -> int:
         return 110
@@ -141,26 +142,48 @@ class CloudFrontServiceHandler(BaseServiceHandler):
     def get_complexity_score(self) -> int:
         return 5  # Medium complexity
 
+_LOAD_BALANCER_INSTRUCTIONS = """
+        ⚖️ ADD ELASTIC LOAD BALANCING SERVICE:
+
+        Step 1: Service Selection
+        - Search for "Load Balancer" in the service search box
+        - Look for "Elastic Load Balancing" service card
+        - Click "Configure" button on the Elastic Load Balancing service card
+        - Verify URL contains "elb" or "load" after page loads
+
+        Step 2: Configuration
+        Configure Load Balancer with these settings:
+        - Region: {region}
+        - Load Balancer Type: {load_balancer_type}
+        - Number of Load Balancers: {number_of_load_balancers}
+        - Processed Bytes: {processed_bytes} {processed_bytes_unit}
+
+""" + add_to_estimate_step("Load Balancer")
+
 class LoadBalancerServiceHandler(BaseServiceHandler):
     """Handler for Elastic Load Balancer service"""
     
+    __slots__ = ()
+    
+    _DEFAULT_CONFIG = MappingProxyType({
+        "load_balancer_type": "Application Load Balancer",
+        "number_of_load_balancers": "1",
+        "processed_bytes": "1",
+        "processed_bytes_unit": "GB",
+        "region": "US East (N. Virginia)"
+    })
+    
     def get_service_name(self) -> str:
         return "Elastic Load Balancing"
     
-    def get_search_terms(self) -> List[str]:
-        return ["Load Balancer", "ELB", "Application Load Balancer", "Network Load Balancer"]
+    def get_search_terms(self) -> Sequence[str]:
+        return ("Load Balancer", "ELB", "Application Load Balancer", "Network Load Balancer")
     
     def get_service_category(self) -> str:
         return "networking"
     
-    def get_default_config(self) -> Dict[str, Any]:
-        return {
-            "load_balancer_type": "Application Load Balancer",
-            "number_of_load_balancers": "1",
-            "processed_bytes": "1",
-            "processed_bytes_unit": "GB",
-            "region": "US East (N. Virginia)"
-        }
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
     
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         errors = []
@@ -176,29 +199,7 @@ class LoadBalancerServiceHandler(BaseServiceHandler):
         return errors
     
     def get_service_instructions(self, config: Dict[str, Any]) -> str:
-        full_config = {**self.get_default_config(), **config}
-        
-        return f"""
-        ⚖️ ADD ELASTIC LOAD BALANCING SERVICE:
-
-        Step 1: Service Selection
-        - Search for "Load Balancer" in the service search box
-        - Look for "Elastic Load Balancing" service card
-        - Click "Configure" button on the Elastic Load Balancing service card
-        - Verify URL contains "elb" or "load" after page loads
-
-        Step 2: Configuration
-        Configure Load Balancer with these settings:
-        - Region: {full_config['region']}
-        - Load Balancer Type: {full_config['load_balancer_type']}
-        - Number of Load Balancers: {full_config['number_of_load_balancers']}
-        - Processed Bytes: {full_config['processed_bytes']} {full_config['processed_bytes_unit']}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm Load Balancer appears in estimate summary
-        """
+        return self.render_instructions(_LOAD_BALANCER_INSTRUCTIONS, config)
     
     def get_timeout_seconds(self) -> int:
         return 120
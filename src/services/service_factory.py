@@ -5,107 +5,127 @@ This module provides utilities for easily creating and registering new AWS servi
 following the service-oriented architecture pattern.
 """
 
-from typing import Dict, Any, List, Type, Optional
-from .service_registry import BaseServiceHandler, service_registry
+from __future__ import annotations
+
+import json
+import sys
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+from .service_registry import BaseServiceHandler, add_to_estimate_step, service_registry
 import logging
 
+if TYPE_CHECKING:
+    # Annotations are postponed, so these are only needed by type checkers
+    from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Type, Union
+
+__all__ = [
+    'ConfigField',
+    'FieldSpecDict',
+    'ServiceDefinition',
+    'ServiceTemplate',
+    'create_basic_service',
+    'get_predefined_service_class',
+    'register_service_from_config',
+    'bulk_register_services',
+    'PREDEFINED_SERVICES',
+    'get_predefined_service_json',
+    'copy_predefined_service',
+    'register_predefined_services'
+]
+
 logger = logging.getLogger(__name__)
 
-class ServiceTemplate:
-    """Template for creating new service handlers quickly"""
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings, lists into tuples and intern strings"""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        # Region names, units and field types repeat across definitions - share one object each
+        return sys.intern(value)
+    return value
+
+class FieldSpecDict(TypedDict, total=False):
+    """Dict form of a field spec, as found in JSON service configs"""
+    name: str
+    type: str
+    required: bool
+    min_value: Optional[float]
+    max_value: Optional[float]
+    options: Sequence[str]
+
+class ServiceDefinition(TypedDict, total=False):
+    """Service definition accepted by register_service_from_config"""
+    service_name: str
+    service_type: str
+    search_terms: Sequence[str]
+    category: str
+    default_config: Mapping[str, Any]
+    config_fields: Sequence[Union[ConfigField, FieldSpecDict]]
+    complexity_score: int
+    timeout_seconds: int
+
+class ConfigField(NamedTuple):
+    """Validation spec for a single service configuration field"""
+    name: str
+    type: str = 'str'
+    required: bool = True
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    # Allowed values; a frozenset so validation is a hash lookup
+    options: Optional[FrozenSet[str]] = None
     
-    @staticmethod
-    def create_basic_service(
-        service_name: str,
-        service_type: str,
-        search_terms: List[str],
-        category: str,
-        default_config: Dict[str, Any],
-        config_fields: List[Dict[str, Any]],
-        complexity_score: int = 5,
-        timeout_seconds: int = 120
-    ) -> Type[BaseServiceHandler]:
-        """
-        Create a basic service handler class dynamically
-        
-        Args:
-            service_name: Official AWS service name (e.g., "Amazon DynamoDB")
-            service_type: Service type key (e.g., "dynamodb")
-            search_terms: List of search terms for finding the service
-            category: Service category (compute, storage, database, etc.)
-            default_config: Default configuration dictionary
-            config_fields: List of required config fields with validation
-            complexity_score: Complexity score 1-10
-            timeout_seconds: Recommended timeout
-        """
-        
-        class DynamicServiceHandler(BaseServiceHandler):
-            def get_service_name(self) -> str:
-                return service_name
-            
-            def get_search_terms(self) -> List[str]:
-                return search_terms
-            
-            def get_service_category(self) -> str:
-                return category
-            
-            def get_default_config(self) -> Dict[str, Any]:
-                return default_config.copy()
-            
-            def validate_config(self, config: Dict[str, Any]) -> List[str]:
-                errors = []
-                
-                for field in config_fields:
-                    field_name = field['name']
-                    field_type = field.get('type', 'str')
-                    required = field.get('required', True)
-                    min_value = field.get('min_value')
-                    max_value = field.get('max_value')
-                    
-                    value = config.get(field_name)
-                    
-                    if required and not value:
-                        errors.append(f"{service_name}: {field_name} is required")
-                        continue
-                    
-                    if value is not None:
-                        # Type validation
-                        if field_type == 'int':
-                            try:
-                                int_val = int(value)
-                                if min_value is not None and int_val < min_value:
-                                    errors.append(f"{service_name}: {field_name} must be at least {min_value}")
-                                if max_value is not None and int_val > max_value:
-                                    errors.append(f"{service_name}: {field_name} must be at most {max_value}")
-                            except (ValueError, TypeError):
-                                errors.append(f"{service_name}: {field_name} must be a valid number")
-                        
-                        elif field_type == 'float':
-                            try:
-                                float_val = float(value)
-                                if min_value is not None and float_val < min_value:
-                                    errors.append(f"{service_name}: {field_name} must be at least {min_value}")
-                                if max_value is not None and float_val > max_value:
-                                    errors.append(f"{service_name}: {field_name} must be at most {max_value}")
-                            except (ValueError, TypeError):
-                                errors.append(f"{service_name}: {field_name} must be a valid number")
-                
-                return errors
-            
-            def get_service_instructions(self, config: Dict[str, Any]) -> str:
-                # Merge with defaults
-                full_config = {**self.get_default_config(), **config}
-                
-                # Build configuration text
-                config_text = []
-                for key, value in full_config.items():
-                    if key != 'region':  # Region is usually first
-                        display_key = key.replace('_', ' ').title()
-                        config_text.append(f"        - {display_key}: {value}")
-                
-                config_section = '\n'.join(config_text)
-                
-                return f"""
+    @classmethod
+    def from_spec(cls, spec: Union[ConfigField, FieldSpecDict]) -> ConfigField:
+        """Accept either a ConfigField or the dict form used in JSON configs"""
+        if isinstance(spec, cls):
+            return spec
+        options = spec.get('options')
+        return cls(
+            name=spec['name'],
+            type=spec.get('type', 'str'),
+            required=spec.get('required', True),
+            min_value=spec.get('min_value'),
+            max_value=spec.get('max_value'),
+            options=frozenset(options) if options is not None else None
+        )
+
+def create_basic_service(
+    service_name: str,
+    service_type: str,
+    search_terms: Sequence[str],
+    category: str,
+    default_config: Dict[str, Any],
+    config_fields: Sequence[Union[ConfigField, FieldSpecDict]],
+    complexity_score: int = 5,
+    timeout_seconds: int = 120
+) -> Type[BaseServiceHandler]:
+    """
+    Create a basic service handler class dynamically
+    
+    Args:
+        service_name: Official AWS service name (e.g., "Amazon DynamoDB")
+        service_type: Service type key (e.g., "dynamodb")
+        search_terms: List of search terms for finding the service
+        category: Service category (compute, storage, database, etc.)
+        default_config: Default configuration dictionary
+        config_fields: Config field specs (ConfigField or dict with the same keys)
+        complexity_score: Complexity score 1-10
+        timeout_seconds: Recommended timeout
+    """
+    
+    # Defaults are shared read-only by every instance; callers merge into a new dict
+    frozen_defaults = default_config if isinstance(default_config, MappingProxyType) else MappingProxyType(dict(default_config))
+    
+    search_terms_tuple = tuple(search_terms)
+    
+    # Normalize field specs once instead of re-reading each dict on every validation
+    field_specs = tuple(ConfigField.from_spec(field) for field in config_fields)
+    
+    # Static parts of the instructions depend only on the service definition - build them once
+    instructions_head = f"""
         🔧 ADD {service_name.upper()} SERVICE:
 
         Step 1: Service Selection
@@ -116,28 +136,119 @@ class ServiceTemplate:
 
         Step 2: Configuration
         Configure {service_name} with these settings:
-        - Region: {full_config.get('region', 'US East (N. Virginia)')}
-{config_section}
-
-        Step 3: Add to Estimate
-        - Scroll to bottom and click "Save and add service"
-        - Verify return to /addService page
-        - Confirm {service_name} appears in estimate summary
-        """
+        - Region: """
+    instructions_tail = "\n\n" + add_to_estimate_step(service_name)
+    
+    class DynamicServiceHandler(BaseServiceHandler):
+        __slots__ = ()
+        
+        def get_service_name(self) -> str:
+            return service_name
+        
+        def get_search_terms(self) -> Sequence[str]:
+            return search_terms_tuple
+        
+        def get_service_category(self) -> str:
+            return category
+        
+        def get_default_config(self) -> Mapping[str, Any]:
+            return frozen_defaults
+        
+        def validate_config(self, config: Dict[str, Any]) -> List[str]:
+            errors = []
+            
+            for field_name, field_type, required, min_value, max_value, options in field_specs:
+                value = config.get(field_name)
+                
+                if required and not value:
+                    errors.append(f"{service_name}: {field_name} is required")
+                    continue
+                
+                if value is not None:
+                    # Type validation
+                    if field_type == 'int':
+                        try:
+                            int_val = int(value)
+                            if min_value is not None and int_val < min_value:
+                                errors.append(f"{service_name}: {field_name} must be at least {min_value}")
+                            if max_value is not None and int_val > max_value:
+                                errors.append(f"{service_name}: {field_name} must be at most {max_value}")
+                        except (ValueError, TypeError):
+                            errors.append(f"{service_name}: {field_name} must be a valid number")
+                    
+                    elif field_type == 'float':
+                        try:
+                            float_val = float(value)
+                            if min_value is not None and float_val < min_value:
+                                errors.append(f"{service_name}: {field_name} must be at least {min_value}")
+                            if max_value is not None and float_val > max_value:
+                                errors.append(f"{service_name}: {field_name} must be at most {max_value}")
+                        except (ValueError, TypeError):
+                            errors.append(f"{service_name}: {field_name} must be a valid number")
+                    
+                    if options is not None:
+                        try:
+                            allowed = value in options
+                        except TypeError:  # unhashable value (list, dict) can't be an option
+                            allowed = False
+                        if not allowed:
+                            errors.append(f"{service_name}: {field_name} must be one of {', '.join(sorted(options))}")
+            
+            return errors
+        
+        def get_service_instructions(self, config: Dict[str, Any]) -> str:
+            # Merge with defaults
+            full_config = {**frozen_defaults, **config}
             
-            def get_timeout_seconds(self) -> int:
-                return timeout_seconds
+            # Build configuration text
+            config_section = '\n'.join([
+                f"        - {key.replace('_', ' ').title()}: {value}"
+                for key, value in full_config.items()
+                if key != 'region'  # Region is usually first
+            ])
+            region = full_config.get('region', 'US East (N. Virginia)')
             
-            def get_complexity_score(self) -> int:
-                return complexity_score
+            return f"{instructions_head}{region}\n{config_section}{instructions_tail}"
         
-        # Set class name for better debugging
-        DynamicServiceHandler.__name__ = f"{service_type.title()}ServiceHandler"
-        DynamicServiceHandler.__qualname__ = f"{service_type.title()}ServiceHandler"
+        def get_timeout_seconds(self) -> int:
+            return timeout_seconds
         
-        return DynamicServiceHandler
+        def get_complexity_score(self) -> int:
+            return complexity_score
+    
+    # Set class name for better debugging
+    DynamicServiceHandler.__name__ = f"{service_type.title()}ServiceHandler"
+    DynamicServiceHandler.__qualname__ = f"{service_type.title()}ServiceHandler"
+    
+    return DynamicServiceHandler
+
+class ServiceTemplate:
+    """Backwards-compatible namespace for create_basic_service"""
+    
+    create_basic_service = staticmethod(create_basic_service)
 
-def register_service_from_config(config: Dict[str, Any]) -> bool:
+def _handler_class_from_config(config: ServiceDefinition) -> Type[BaseServiceHandler]:
+    """Build a handler class from a validated service configuration"""
+    return create_basic_service(
+        service_name=config['service_name'],
+        service_type=config['service_type'],
+        search_terms=config['search_terms'],
+        category=config['category'],
+        default_config=config['default_config'],
+        config_fields=config.get('config_fields', []),
+        complexity_score=config.get('complexity_score', 5),
+        timeout_seconds=config.get('timeout_seconds', 120)
+    )
+
+@lru_cache(maxsize=None)
+def get_predefined_service_class(service_type: str) -> Optional[Type[BaseServiceHandler]]:
+    """Handler class for a predefined service, generated once per service type"""
+    config = PREDEFINED_SERVICES.get(service_type)
+    if config is None:
+        return None
+    return _handler_class_from_config(config)
+
+def register_service_from_config(config: ServiceDefinition) -> bool:
     """
     Register a service from configuration dictionary
     
@@ -166,33 +277,27 @@ def register_service_from_config(config: Dict[str, Any]) -> bool:
         
         for field in required_fields:
             if field not in config:
-                logger.error(f"❌ Missing required field: {field}")
+                logger.error("❌ Missing required field: %s", field)
                 return False
         
-        # Create service handler class
-        handler_class = ServiceTemplate.create_basic_service(
-            service_name=config['service_name'],
-            service_type=config['service_type'],
-            search_terms=config['search_terms'],
-            category=config['category'],
-            default_config=config['default_config'],
-            config_fields=config.get('config_fields', []),
-            complexity_score=config.get('complexity_score', 5),
-            timeout_seconds=config.get('timeout_seconds', 120)
-        )
+        # Create service handler class (predefined definitions are frozen, so reuse their class)
+        if PREDEFINED_SERVICES.get(config['service_type']) is config:
+            handler_class = get_predefined_service_class(config['service_type'])
+        else:
+            handler_class = _handler_class_from_config(config)
         
         # Register the service
         handler = handler_class()
         service_registry.register_service(config['service_type'], handler)
         
-        logger.info(f"✅ Service registered from config: {config['service_type']}")
+        logger.info("✅ Service registered from config: %s", config['service_type'])
         return True
         
     except Exception as e:
-        logger.error(f"❌ Failed to register service from config: {e}")
+        logger.error("❌ Failed to register service from config: %s", e)
         return False
 
-def bulk_register_services(services_config: List[Dict[str, Any]]) -> Dict[str, bool]:
+def bulk_register_services(services_config: Sequence[ServiceDefinition]) -> Dict[str, bool]:
     """Register multiple services from configuration list"""
     results = {}
     
@@ -203,10 +308,23 @@ def bulk_register_services(services_config: List[Dict[str, Any]]) -> Dict[str, b
     successful = sum(1 for success in results.values() if success)
     total = len(results)
     
-    logger.info(f"📊 Bulk registration completed: {successful}/{total} services registered")
+    logger.info("📊 Bulk registration completed: %s/%s services registered", successful, total)
     
     return results
 
+# Building blocks shared by the predefined definitions - one object, many references
+_DEFAULT_REGION = "US East (N. Virginia)"
+
+@lru_cache(maxsize=None)
+def _positive_int(field_name: str) -> ConfigField:
+    """Shared spec for a required integer field that must be at least 1"""
+    return ConfigField(field_name, "int", min_value=1)
+
+@lru_cache(maxsize=None)
+def _unit(field_name: str, *units: str) -> ConfigField:
+    """Shared spec for an optional unit field limited to the units the calculator offers"""
+    return ConfigField(field_name, required=False, options=frozenset(units))
+
 # Predefined service configurations for easy registration
 PREDEFINED_SERVICES = {
     "dynamodb": {
@@ -219,12 +337,13 @@ PREDEFINED_SERVICES = {
             "write_capacity": "5",
             "storage_size": "1",
             "storage_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "region": _DEFAULT_REGION
         },
         "config_fields": [
-            {"name": "read_capacity", "type": "int", "required": True, "min_value": 1},
-            {"name": "write_capacity", "type": "int", "required": True, "min_value": 1},
-            {"name": "storage_size", "type": "int", "required": True, "min_value": 1}
+            _positive_int("read_capacity"),
+            _positive_int("write_capacity"),
+            _positive_int("storage_size"),
+            _unit("storage_unit", "KB", "MB", "GB", "TB")
         ],
         "complexity_score": 6,
         "timeout_seconds": 130
@@ -239,11 +358,12 @@ PREDEFINED_SERVICES = {
             "data_transfer": "100",
             "data_transfer_unit": "GB",
             "requests": "1000000",
-            "region": "US East (N. Virginia)"
+            "region": _DEFAULT_REGION
         },
         "config_fields": [
-            {"name": "data_transfer", "type": "int", "required": True, "min_value": 1},
-            {"name": "requests", "type": "int", "required": True, "min_value": 1}
+            _positive_int("data_transfer"),
+            _positive_int("requests"),
+            _unit("data_transfer_unit", "GB", "TB")
         ],
         "complexity_score": 4,
         "timeout_seconds": 100
@@ -258,24 +378,81 @@ PREDEFINED_SERVICES = {
             "requests_per_month": "1000000",
             "data_transfer": "1",
             "data_transfer_unit": "GB",
-            "region": "US East (N. Virginia)"
+            "region": _DEFAULT_REGION
         },
         "config_fields": [
-            {"name": "requests_per_month", "type": "int", "required": True, "min_value": 1},
-            {"name": "data_transfer", "type": "int", "required": True, "min_value": 1}
+            _positive_int("requests_per_month"),
+            _positive_int("data_transfer"),
+            _unit("data_transfer_unit", "KB", "MB", "GB", "TB")
         ],
         "complexity_score": 5,
         "timeout_seconds": 110
     }
 }
 
+# Predefined definitions are shared reference data - freeze once at import.
+# Nested dicts become MappingProxyType and lists become tuples, so definitions
+# can be handed out without defensive copies; use copy_predefined_service() to edit one.
+PREDEFINED_SERVICES = _freeze(PREDEFINED_SERVICES)
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: rebuild plain dicts and lists"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple) and not isinstance(value, ConfigField):
+        return [_thaw(item) for item in value]
+    return value
+
+def copy_predefined_service(service_type: str) -> Optional[ServiceDefinition]:
+    """Mutable deep copy of a predefined service definition, e.g. to customize before registering"""
+    config = PREDEFINED_SERVICES.get(service_type)
+    return _thaw(config) if config is not None else None
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert frozen definitions back to JSON-compatible structures (field specs as dicts)"""
+    if isinstance(value, ConfigField):
+        spec = value._asdict()
+        if value.options is not None:
+            spec['options'] = sorted(value.options)
+        return spec
+    if isinstance(value, MappingProxyType):
+        return {key: _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_to_jsonable(item) for item in value]
+    return value
+
+# Serialized once so API/UI callers can send definitions without re-walking them
+_PREDEFINED_SERVICES_JSON: Dict[str, bytes] = {
+    service_type: json.dumps(_to_jsonable(config), ensure_ascii=False).encode("utf-8")
+    for service_type, config in PREDEFINED_SERVICES.items()
+}
+
+def get_predefined_service_json(service_type: str) -> Optional[bytes]:
+    """UTF-8 JSON of a predefined service definition, in the register_service_from_config format"""
+    return _PREDEFINED_SERVICES_JSON.get(service_type)
+
+def _create_predefined_handler(service_type: str) -> BaseServiceHandler:
+    """Instantiate the handler for a predefined service on first lookup"""
+    return get_predefined_service_class(service_type)()
+
 def register_predefined_services(service_names: Optional[List[str]] = None) -> Dict[str, bool]:
     """Register predefined services"""
     if service_names is None:
         service_names = list(PREDEFINED_SERVICES.keys())
     
-    configs = [PREDEFINED_SERVICES[name] for name in service_names if name in PREDEFINED_SERVICES]
-    return bulk_register_services(configs)
+    # Predefined definitions are known-valid; defer class generation and instantiation
+    # until a workflow actually asks for the handler
+    results = {}
+    for name in service_names:
+        config = PREDEFINED_SERVICES.get(name)
+        if config is None:
+            continue
+        service_registry.register_lazy(name, partial(_create_predefined_handler, name), config["category"])
+        results[name] = True
+    
+    logger.info("📊 Predefined registration completed: %d/%d services registered lazily", len(results), len(service_names))
+    
+    return results
 
 # Auto-register some common services
 if __name__ != "__main__":
@@ -5,19 +5,72 @@ This module implements a registry pattern for AWS services, allowing easy
 addition of new services without modifying core browser agent code.
 """
 
-from typing import Dict, Any, List, Type, Optional
+from typing import Callable, Dict, Any, List, Type, Optional, Mapping, Sequence, Tuple, Union
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _render_instructions(template: str, defaults_owner: type, config_key: frozenset) -> str:
+    """Render instruction template once per (handler class, config) combination"""
+    config = {key: value for key, _, value in config_key}
+    return template.format_map(ChainMap(config, defaults_owner._DEFAULT_CONFIG))
+
+# Closing step shared by the single-page service instructions
+_ADD_TO_ESTIMATE_STEP = """        Step 3: Add to Estimate
+        - Scroll to bottom and click "Save and add service"
+        - Verify return to /addService page
+        - Confirm %s appears in estimate summary
+        """
+
+def add_to_estimate_step(service_label: str) -> str:
+    """Standard "Step 3: Add to Estimate" block, appended to instruction templates at import"""
+    return _ADD_TO_ESTIMATE_STEP % service_label
+
+def parse_int(value: Any) -> Optional[int]:
+    """
+    Parse a config value the way int() does, returning None if it can't be parsed
+    
+    Ints pass straight through, so only malformed values pay for an exception.
+    """
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 class BaseServiceHandler(ABC):
     """Base class for all AWS service handlers"""
     
-    def __init__(self):
-        self.service_name = self.get_service_name()
-        self.search_terms = self.get_search_terms()
-        self.category = self.get_service_category()
+    # Handlers are stateless singletons - no per-instance __dict__.
+    # Subclasses declare __slots__ = () to keep it that way.
+    __slots__ = ()
+    
+    # Read-only defaults used by render_instructions(); handlers override this
+    _DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({})
+    
+    # Numeric fields parsed to int once by coerce_config()
+    _INT_FIELDS: Tuple[str, ...] = ()
+    
+    # Kept as properties instead of being copied in __init__, so constructing
+    # a handler doesn't call every getter up front
+    @property
+    def service_name(self) -> str:
+        return self.get_service_name()
+    
+    @property
+    def search_terms(self) -> Sequence[str]:
+        return self.get_search_terms()
+    
+    @property
+    def category(self) -> str:
+        return self.get_service_category()
     
     @abstractmethod
     def get_service_name(self) -> str:
@@ -25,8 +78,8 @@ class BaseServiceHandler(ABC):
         pass
     
     @abstractmethod
-    def get_search_terms(self) -> List[str]:
-        """Return search terms for finding the service in AWS Calculator"""
+    def get_search_terms(self) -> Sequence[str]:
+        """Return search terms for finding the service in AWS Calculator (read-only sequence)"""
         pass
     
     @abstractmethod
@@ -49,6 +102,32 @@ class BaseServiceHandler(ABC):
         """Return default configuration for this service"""
         pass
     
+    def coerce_config(self, config: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of config with digit strings in _INT_FIELDS parsed to int
+        
+        Meant to run once per request, so "2" and 2 share the validation and
+        instruction caches. Values that don't parse are kept for validate_config to report.
+        """
+        coerced = dict(config)
+        for field in self._INT_FIELDS:
+            value = coerced.get(field)
+            if type(value) is str:
+                parsed = parse_int(value)
+                if parsed is not None:
+                    coerced[field] = parsed
+        return coerced
+    
+    def render_instructions(self, template: str, config: Mapping[str, Any]) -> str:
+        """Fill a str.format template from config over _DEFAULT_CONFIG (memoized)"""
+        try:
+            # Value type is part of the key so 20 and 20.0 don't share a rendering
+            config_key = frozenset((key, type(value), value) for key, value in config.items())
+            return _render_instructions(template, type(self), config_key)
+        except TypeError:
+            # Unhashable values (lists, dicts) - render without the cache
+            return template.format_map(ChainMap(config, self._DEFAULT_CONFIG))
+    
     def get_timeout_seconds(self) -> int:
         """Return recommended timeout for this service (can be overridden)"""
         return 120  # Default 2 minutes
@@ -57,50 +136,228 @@ class BaseServiceHandler(ABC):
         """Return complexity score 1-10 for workflow planning"""
         return 5  # Default medium complexity
 
+class SpecServiceHandler(BaseServiceHandler):
+    """
+    Handler described entirely by class constants
+    
+    For services with a single instruction template and validation made of
+    required fields and integer ranges. Subclasses only set the constants;
+    every such handler shares these method bodies.
+    """
+    
+    __slots__ = ()
+    
+    _SERVICE_NAME: str = ""
+    _SEARCH_TERMS: Tuple[str, ...] = ()
+    _CATEGORY: str = ""
+    _INSTRUCTIONS: str = ""
+    _TIMEOUT_SECONDS: int = 120
+    _COMPLEXITY_SCORE: int = 5
+    
+    # Prefix of validation messages, e.g. "Lambda"
+    _LABEL: str = ""
+    _REQUIRED_FIELDS: Tuple[str, ...] = ()
+    # (field, min, max, message suffix when out of range) - None leaves that side open,
+    # and the suffix may be a (too low, too high) pair. Missing fields are checked
+    # against their _DEFAULT_CONFIG value.
+    _INT_RANGES: Tuple[Tuple[str, Optional[int], Optional[int], Union[str, Tuple[str, str]]], ...] = ()
+    
+    # _INT_RANGES with the full error messages, built once per class
+    _RANGE_CHECKS: Tuple[Tuple[str, Optional[int], Optional[int], str, str, str], ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        checks = []
+        for field, min_value, max_value, range_error in cls._INT_RANGES:
+            too_low, too_high = (range_error, range_error) if isinstance(range_error, str) else range_error
+            checks.append((
+                field, min_value, max_value,
+                f"{cls._LABEL}: {field} must be a valid number",
+                f"{cls._LABEL}: {field} {too_low}",
+                f"{cls._LABEL}: {field} {too_high}"
+            ))
+        cls._RANGE_CHECKS = tuple(checks)
+        
+        # Range-checked fields are the ones coerce_config() should parse
+        if "_INT_FIELDS" not in cls.__dict__:
+            cls._INT_FIELDS = tuple(field for field, *_ in cls._INT_RANGES)
+    
+    def get_service_name(self) -> str:
+        return self._SERVICE_NAME
+    
+    def get_search_terms(self) -> Sequence[str]:
+        return self._SEARCH_TERMS
+    
+    def get_service_category(self) -> str:
+        return self._CATEGORY
+    
+    def get_default_config(self) -> Mapping[str, Any]:
+        return self._DEFAULT_CONFIG
+    
+    def validate_config(self, config: Dict[str, Any]) -> List[str]:
+        errors = [f"{self._LABEL}: {field} is required" for field in self._REQUIRED_FIELDS if not config.get(field)]
+        
+        for field, min_value, max_value, invalid_error, low_error, high_error in self._RANGE_CHECKS:
+            value = parse_int(config.get(field, self._DEFAULT_CONFIG[field]))
+            if value is None:
+                errors.append(invalid_error)
+            elif min_value is not None and value < min_value:
+                errors.append(low_error)
+            elif max_value is not None and value > max_value:
+                errors.append(high_error)
+        
+        return errors
+    
+    def get_service_instructions(self, config: Dict[str, Any]) -> str:
+        return self.render_instructions(self._INSTRUCTIONS, config)
+    
+    def get_timeout_seconds(self) -> int:
+        return self._TIMEOUT_SECONDS
+    
+    def get_complexity_score(self) -> int:
+        return self._COMPLEXITY_SCORE
+
 class ServiceRegistry:
     """Registry for managing AWS service handlers"""
     
     def __init__(self):
         self._services: Dict[str, BaseServiceHandler] = {}
-        self._categories: Dict[str, List[str]] = {}
+        self._lazy_factories: Dict[str, Callable[[], BaseServiceHandler]] = {}
+        # Guards registration and lazy instantiation; re-entrant because a factory
+        # may import a module that registers (and looks up) further services
+        self._lock = threading.RLock()
+        self._loading: set = set()  # factories currently running
+        # Tuples so lookups can hand out the stored value without copying
+        self._categories: Dict[str, Tuple[str, ...]] = {}
+        
+        # Plans and validation results only depend on the registered handlers,
+        # so they are memoized per registry and dropped whenever a service is registered
+        self._cached_workflow_plan = lru_cache(maxsize=64)(self._build_workflow_plan)
+        self._cached_validation = lru_cache(maxsize=256)(self._validate_frozen_config)
         logger.info("🏗️ ServiceRegistry initialized")
     
+    def _invalidate_caches(self):
+        self._cached_workflow_plan.cache_clear()
+        self._cached_validation.cache_clear()
+    
+    def _add_to_category(self, category: str, service_type: str):
+        # Registration is rare, lookups are not - rebuild the tuple here
+        services = self._categories.get(category, ())
+        if service_type not in services:
+            self._categories[category] = (*services, service_type)
+    
     def register_service(self, service_type: str, handler: BaseServiceHandler):
         """Register a new service handler"""
-        self._services[service_type] = handler
+        with self._lock:
+            self._services[service_type] = handler
+            self._lazy_factories.pop(service_type, None)
+            self._invalidate_caches()
+            
+            # Update category mapping
+            self._add_to_category(handler.get_service_category(), service_type)
         
-        # Update category mapping
-        category = handler.get_service_category()
-        if category not in self._categories:
-            self._categories[category] = []
-        self._categories[category].append(service_type)
+        logger.info("✅ Registered service: %s (%s)", service_type, handler.get_service_name())
+    
+    def register_lazy(self, service_type: str, factory: Callable[[], BaseServiceHandler], category: str):
+        """Register a handler factory; the handler is only created on first lookup"""
+        with self._lock:
+            self._lazy_factories[service_type] = factory
+            self._services.pop(service_type, None)
+            self._invalidate_caches()
+            
+            # Category is known up front so category queries don't force instantiation
+            self._add_to_category(category, service_type)
         
-        logger.info(f"✅ Registered service: {service_type} ({handler.get_service_name()})")
+        logger.info("✅ Registered service (lazy): %s", service_type)
     
     def get_handler(self, service_type: str) -> Optional[BaseServiceHandler]:
         """Get handler for a service type"""
-        return self._services.get(service_type)
+        handler = self._services.get(service_type)
+        if handler is not None:
+            return handler
+        
+        with self._lock:
+            # Another thread may have built it while we waited for the lock
+            handler = self._services.get(service_type)
+            factory = self._lazy_factories.get(service_type)
+            if handler is not None or factory is None or factory in self._loading:
+                return handler
+            
+            # The factory stays registered until it succeeds, so a failed import can be retried
+            self._loading.add(factory)
+            try:
+                handler = factory()
+            finally:
+                self._loading.discard(factory)
+            
+            if handler is not None:
+                self._services[service_type] = handler
+                if self._lazy_factories.get(service_type) is factory:
+                    del self._lazy_factories[service_type]
+            return handler
     
     def get_all_services(self) -> List[str]:
         """Get list of all registered service types"""
-        return list(self._services.keys())
+        with self._lock:
+            return [*self._services, *self._lazy_factories]
     
     def get_services_by_category(self, category: str) -> List[str]:
         """Get services in a specific category"""
-        return self._categories.get(category, [])
+        return list(self._categories.get(category, ()))
     
     def get_categories(self) -> List[str]:
         """Get all available categories"""
-        return list(self._categories.keys())
+        return list(self._categories)
     
-    def validate_service_config(self, service_type: str, config: Dict[str, Any]) -> List[str]:
-        """Validate configuration for a service"""
+    def _validate_frozen_config(self, service_type: str, config_key: frozenset) -> Tuple[str, ...]:
+        config = {key: value for key, _, value in config_key}
+        return tuple(self._validate_uncached(service_type, config))
+    
+    def _validate_uncached(self, service_type: str, config: Dict[str, Any]) -> List[str]:
         handler = self.get_handler(service_type)
         if not handler:
             return [f"Unknown service type: {service_type}"]
         
         return handler.validate_config(config)
     
+    def validate_service_config(self, service_type: str, config: Dict[str, Any]) -> List[str]:
+        """Validate configuration for a service (memoized for hashable configs)"""
+        try:
+            # Value type is part of the key so 1 and "1" are validated separately
+            config_key = frozenset((key, type(value), value) for key, value in config.items())
+            return list(self._cached_validation(service_type, config_key))
+        except TypeError:
+            # Unhashable values (lists, dicts) - validate without the cache
+            return self._validate_uncached(service_type, config)
+    
+    def coerce_many(self, services_config: Mapping[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Coerce every config with its handler (unknown services are passed through)"""
+        coerced = {}
+        for service_type, config in services_config.items():
+            handler = self.get_handler(service_type)
+            coerced[service_type] = handler.coerce_config(config) if handler else config
+        return coerced
+    
+    def validate_many(self, services_config: Mapping[str, Dict[str, Any]], fail_fast: bool = False) -> List[str]:
+        """
+        Validate several service configs in one call
+        
+        With fail_fast=True, stops at the first service that has errors and
+        returns only that service's errors.
+        """
+        if not fail_fast:
+            return [
+                error
+                for service_type, config in services_config.items()
+                for error in self.validate_service_config(service_type, config)
+            ]
+        
+        for service_type, config in services_config.items():
+            errors = self.validate_service_config(service_type, config)
+            if errors:
+                return errors
+        return []
+    
     def get_service_instructions(self, service_type: str, config: Dict[str, Any]) -> str:
         """Get browser instructions for a service"""
         handler = self.get_handler(service_type)
@@ -110,7 +367,21 @@ class ServiceRegistry:
         return handler.get_service_instructions(config)
     
     def get_workflow_plan(self, services: List[str]) -> Dict[str, Any]:
-        """Generate optimized workflow plan for multiple services"""
+        """
+        Generate optimized workflow plan for multiple services
+        
+        Plans are memoized per service list and stored with tuple sequences;
+        callers get fresh lists, so they can't corrupt the cache.
+        """
+        plan = self._cached_workflow_plan(tuple(services))
+        return {
+            **plan,
+            "services": list(plan["services"]),
+            "service_order": list(plan["service_order"]),
+            "category_groups": {category: list(group) for category, group in plan["category_groups"].items()}
+        }
+    
+    def _build_workflow_plan(self, services: Tuple[str, ...]) -> Dict[str, Any]:
         plan = {
             "services": services,
             "total_estimated_time": 0,
@@ -144,7 +415,8 @@ class ServiceRegistry:
             if service not in ordered_services:
                 ordered_services.append(service)
         
-        plan["service_order"] = ordered_services
+        plan["service_order"] = tuple(ordered_services)
+        plan["category_groups"] = {category: tuple(group) for category, group in plan["category_groups"].items()}
         plan["average_complexity"] = plan["complexity_score"] / len(services) if services else 0
         
         return plan
@@ -4,9 +4,7 @@ Module để cấu hình và tạo kết nối với AWS Bedrock
 """
 
 import os
-import boto3
-from langchain_aws import ChatBedrock
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 from .rate_limiter import bedrock_rate_limiter, with_retry_and_backoff
@@ -14,14 +12,19 @@ from .rate_limiter import bedrock_rate_limiter, with_retry_and_backoff
 # Load environment variables from .env file
 load_dotenv()
 
+if TYPE_CHECKING:
+    from langchain_aws import ChatBedrock
+
 logger = logging.getLogger(__name__)
 
 class BedrockConfig:
     """Configuration class for AWS Bedrock with Singleton pattern"""
     
     _instance = None
-    _client = None
     _credentials_validated = False
+    # Shared clients keyed on (model_id, region, access_key_id, temperature, max_tokens)
+    # để mọi agent reuse cùng boto3 connection pool
+    _LLM_CACHE: Dict[Tuple[str, str, Optional[str], float, int], "ChatBedrock"] = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -38,27 +41,33 @@ class BedrockConfig:
             self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
             self._initialized = True
         
-    def create_bedrock_client(self) -> ChatBedrock:
+    def create_bedrock_client(self, temperature: float = 0.1, max_tokens: int = 1024) -> "ChatBedrock":
         """
-        Tạo ChatBedrock client với singleton pattern và rate limiting
+        Tạo ChatBedrock client với rate limiting, shared giữa các callers dùng cùng settings
         """
+        cache_key = (self.model_id, self.region_name, self.aws_access_key_id, temperature, max_tokens)
+        
         # Return existing client if available
-        if self._client is not None:
-            logger.info(f"♻️ Reusing existing Bedrock client - Model: {self.model_id}")
-            return self._client
+        cached_client = self._LLM_CACHE.get(cache_key)
+        if cached_client is not None:
+            logger.info("♻️ Reusing existing Bedrock client - Model: %s", self.model_id)
+            return cached_client
             
         try:
+            # Lazy import - langchain_aws chỉ load khi thực sự cần client
+            from langchain_aws import ChatBedrock
+            
             # Tạo ChatBedrock client với rate limiting
             bedrock_client = ChatBedrock(
                 model_id=self.model_id,
                 region_name=self.region_name,
                 credentials_profile_name=None,  # Sử dụng env vars
-                temperature=0.1,
+                temperature=temperature,
                 max_tokens=2048,  # Giảm token để tránh throttling
                 # Claude 3.5 Sonnet specific configurations với rate limiting
                 model_kwargs={
-                    "max_tokens": 1024,  # Giảm xuống 1024 để tránh token limits
-                    "temperature": 0.1,
+                    "max_tokens": max_tokens,  # Mặc định 1024 để tránh token limits
+                    "temperature": temperature,
                     "top_p": 0.9,
                     "stop_sequences": ["\n\nHuman:"]
                 }
@@ -76,12 +85,12 @@ class BedrockConfig:
                 bedrock_client._generate = rate_limited_generate
             
             # Cache the client
-            self._client = bedrock_client
-            logger.info(f"✅ AWS Bedrock client created with rate limiting - Model: {self.model_id}")
+            self._LLM_CACHE[cache_key] = bedrock_client
+            logger.info("✅ AWS Bedrock client created with rate limiting - Model: %s", self.model_id)
             return bedrock_client
             
         except Exception as e:
-            logger.error(f"❌ Failed to create Bedrock client: {str(e)}")
+            logger.error("❌ Failed to create Bedrock client: %s", e)
             raise
 
     def validate_credentials(self) -> bool:
@@ -93,6 +102,8 @@ class BedrockConfig:
             return True
             
         try:
+            import boto3
+            
             session = boto3.Session(
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
@@ -104,17 +115,17 @@ class BedrockConfig:
             identity = sts.get_caller_identity()
             
             self._credentials_validated = True
-            logger.info(f"✅ AWS Credentials valid. Account: {identity.get('Account')}")
+            logger.info("✅ AWS Credentials valid. Account: %s", identity.get('Account'))
             return True
             
         except Exception as e:
-            logger.error(f"❌ Invalid AWS credentials: {str(e)}")
+            logger.error("❌ Invalid AWS credentials: %s", e)
             return False
 
 # Global singleton instance
 _bedrock_config = None
 
-def get_bedrock_llm(temperature: float = 0.1, max_tokens: int = 4096) -> ChatBedrock:
+def get_bedrock_llm(temperature: float = 0.1, max_tokens: int = 4096) -> "ChatBedrock":
     """
     Convenience function để tạo ChatBedrock instance với singleton pattern
     
@@ -134,11 +145,5 @@ def get_bedrock_llm(temperature: float = 0.1, max_tokens: int = 4096) -> ChatBed
     if not _bedrock_config.validate_credentials():
         raise ValueError("❌ Invalid AWS credentials. Please check your environment variables.")
     
-    bedrock_client = _bedrock_config.create_bedrock_client()
-    
-    # Override temperature và max_tokens nếu được cung cấp
-    bedrock_client.temperature = temperature
-    bedrock_client.model_kwargs["temperature"] = temperature
-    bedrock_client.model_kwargs["max_tokens"] = max_tokens
-    
-    return bedrock_client 
\ No newline at end of file
+    # Mỗi bộ settings có client riêng, tránh override temperature của client đang được share
+    return _bedrock_config.create_bedrock_client(temperature=temperature, max_tokens=max_tokens) 
\ No newline at end of file
@@ -6,19 +6,24 @@ Module để cấu hình và tạo kết nối với OpenAI API
 import os
 import logging
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Shared ChatOpenAI clients keyed on (model, api_key, temperature, max_tokens)
+# để mọi agent reuse cùng httpx connection pool
+_LLM_CACHE: Dict[Tuple[str, Optional[str], float, int], "ChatOpenAI"] = {}
+
 class OpenAIConfig:
     """Configuration class for OpenAI with Singleton pattern"""
     
     _instance = None
-    _client = None
     _api_key_validated = False
     
     def __new__(cls):
@@ -34,34 +39,40 @@ class OpenAIConfig:
             self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
             self._initialized = True
         
-    def create_openai_client(self) -> ChatOpenAI:
+    def create_openai_client(self, temperature: float = 0.1, max_tokens: int = 2048) -> "ChatOpenAI":
         """
-        Tạo ChatOpenAI client với singleton pattern
+        Tạo ChatOpenAI client, shared giữa các callers dùng cùng settings
         """
+        cache_key = (self.model_name, self.api_key, temperature, max_tokens)
+        
         # Return existing client if available
-        if self._client is not None:
-            logger.info(f"♻️ Reusing existing OpenAI client - Model: {self.model_name}")
-            return self._client
+        cached_client = _LLM_CACHE.get(cache_key)
+        if cached_client is not None:
+            logger.info("♻️ Reusing existing OpenAI client - Model: %s", self.model_name)
+            return cached_client
             
         try:
+            # Lazy import - langchain_openai chỉ load khi thực sự cần client
+            from langchain_openai import ChatOpenAI
+            
             # Tạo ChatOpenAI client
             openai_client = ChatOpenAI(
                 model=self.model_name,
                 api_key=self.api_key,
                 base_url=self.base_url,
-                temperature=0.1,
-                max_tokens=2048,
+                temperature=temperature,
+                max_tokens=max_tokens,
                 max_retries=3,
                 request_timeout=30
             )
             
             # Cache the client
-            self._client = openai_client
-            logger.info(f"✅ OpenAI client created - Model: {self.model_name}")
+            _LLM_CACHE[cache_key] = openai_client
+            logger.info("✅ OpenAI client created - Model: %s", self.model_name)
             return openai_client
             
         except Exception as e:
-            logger.error(f"❌ Failed to create OpenAI client: {str(e)}")
+            logger.error("❌ Failed to create OpenAI client: %s", e)
             raise
 
     def validate_api_key(self) -> bool:
@@ -81,6 +92,8 @@ class OpenAIConfig:
             return False
             
         try:
+            from langchain_openai import ChatOpenAI
+            
             # Test API key with a simple request
             test_client = ChatOpenAI(
                 model=self.model_name,
@@ -94,17 +107,17 @@ class OpenAIConfig:
             test_client.invoke([HumanMessage(content="Hi")])
             
             self._api_key_validated = True
-            logger.info(f"✅ OpenAI API key valid for model: {self.model_name}")
+            logger.info("✅ OpenAI API key valid for model: %s", self.model_name)
             return True
             
         except Exception as e:
-            logger.error(f"❌ OpenAI API key validation failed: {str(e)}")
+            logger.error("❌ OpenAI API key validation failed: %s", e)
             return False
 
 # Global singleton instance
 _openai_config = None
 
-def get_openai_llm(temperature: float = 0.1, max_tokens: int = 4096) -> ChatOpenAI:
+def get_openai_llm(temperature: float = 0.1, max_tokens: int = 4096) -> "ChatOpenAI":
     """
     Convenience function để tạo ChatOpenAI instance với singleton pattern
     
@@ -124,10 +137,5 @@ def get_openai_llm(temperature: float = 0.1, max_tokens: int = 4096) -> ChatOpen
     if not _openai_config.validate_api_key():
         raise ValueError("❌ Invalid OpenAI API key. Please check your environment variables.")
     
-    openai_client = _openai_config.create_openai_client()
-    
-    # Override temperature và max_tokens nếu được cung cấp
-    openai_client.temperature = temperature
-    openai_client.max_tokens = max_tokens
-    
-    return openai_client 
\ No newline at end of file
+    # Mỗi bộ settings có client riêng, tránh override temperature của client đang được share
+    return _openai_config.create_openai_client(temperature=temperature, max_tokens=max_tokens) 
\ No newline at end of file
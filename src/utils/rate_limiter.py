@@ -39,7 +39,7 @@ class BedrockRateLimiter:
         if self.request_count >= self.requests_per_minute:
             wait_time = 60 - (current_time - self.minute_start)
             if wait_time > 0:
-                logger.info(f"⏳ Rate limit reached. Waiting {wait_time:.2f}s...")
+                logger.info("⏳ Rate limit reached. Waiting %.2fs...", wait_time)
                 time.sleep(wait_time)
                 self.request_count = 0
                 self.minute_start = time.time()
@@ -76,7 +76,7 @@ def with_retry_and_backoff(max_retries: int = 3, base_delay: float = 1.0):
                         if attempt < max_retries:
                             # Exponential backoff với jitter - longer delays cho Bedrock
                             delay = base_delay * (3 ** attempt) + random.uniform(1, 5)
-                            logger.warning(f"⚠️ AWS Bedrock Throttling detected. Retrying in {delay:.2f}s... (attempt {attempt + 1}/{max_retries + 1})")
+                            logger.warning("⚠️ AWS Bedrock Throttling detected. Retrying in %.2fs... (attempt %s/%s)", delay, attempt + 1, max_retries + 1)
                             time.sleep(delay)
                             continue
                         else:
@@ -90,7 +90,7 @@ def with_retry_and_backoff(max_retries: int = 3, base_delay: float = 1.0):
                     last_exception = e
                     if attempt < max_retries:
                         delay = base_delay * (2 ** attempt)
-                        logger.warning(f"⚠️ Request failed. Retrying in {delay:.2f}s... (attempt {attempt + 1}/{max_retries + 1})")
+                        logger.warning("⚠️ Request failed. Retrying in %.2fs... (attempt %s/%s)", delay, attempt + 1, max_retries + 1)
                         time.sleep(delay)
                         continue
                     else:
@@ -0,0 +1,121 @@
+"""
+Estimate Result Cache
+Cache kết quả estimation workflow, key theo hash của services_config
+L1: LRU trong memory, L2: JSON files trên disk
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    # orjson (C extension) nhanh hơn nhiều khi serialize config; optional dependency
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# TTL mặc định cho cached results (giây) - 0 để tắt cache
+DEFAULT_TTL_SECONDS = int(os.getenv("ESTIMATE_CACHE_TTL", "86400"))
+
+# Số entries tối đa giữ trong memory (L1)
+DEFAULT_MEMORY_SIZE = 128
+
+
+def config_cache_key(services_config: Dict[str, Any]) -> str:
+    """
+    Tạo cache key ổn định từ services configuration
+
+    Args:
+        services_config: Configuration của các services cần estimate
+
+    Returns:
+        SHA-256 hex digest của JSON đã sort keys
+    """
+    if orjson is not None:
+        payload = orjson.dumps(services_config, default=str,
+                               option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        # Compact separators + UTF-8 để ra cùng bytes như orjson
+        payload = json.dumps(services_config, sort_keys=True, default=str,
+                             separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class EstimateResultCache:
+    """Two-level cache (memory LRU + disk) với TTL cho kết quả của browser workflow"""
+
+    def __init__(self, cache_dir: Optional[str] = None, memory_size: int = DEFAULT_MEMORY_SIZE):
+        self.cache_dir = Path(cache_dir or os.getenv("ESTIMATE_CACHE_DIR", ".cache/estimates"))
+        self.memory_size = memory_size
+        # key -> (stored_at, result), thứ tự = recently used
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _remember(self, key: str, stored_at: float, result: Dict[str, Any]):
+        """Đưa bản deep copy của entry vào L1, evict entry ít dùng nhất khi đầy"""
+        self._memory[key] = (stored_at, copy.deepcopy(result))
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> Optional[Dict[str, Any]]:
+        """Lấy bản copy của cached result nếu còn hạn, None nếu miss hoặc hết hạn"""
+        if ttl_seconds <= 0:
+            return None
+
+        # L1: memory
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, result = entry
+            if time.time() - stored_at <= ttl_seconds:
+                self._memory.move_to_end(key)
+                # Caller được phép sửa result mà không làm hỏng entry trong L1
+                return copy.deepcopy(result)
+            del self._memory[key]
+
+        # L2: disk
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ Unreadable cache entry %s: %s", key, e)
+            return None
+
+        stored_at = entry.get("stored_at", 0)
+        if time.time() - stored_at > ttl_seconds:
+            return None
+
+        result = entry.get("result")
+        if result is not None:
+            self._remember(key, stored_at, result)
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]):
+        """Lưu result vào disk (atomic replace để tránh file ghi dở)"""
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        stored_at = time.time()
+        self._remember(key, stored_at, result)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": stored_at, "result": result}, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠️ Failed to write cache entry %s: %s", key, e)
+
+# Global cache instance
+estimate_result_cache = EstimateResultCache()
@@ -5,7 +5,38 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from config.predefined_templates import get_service_template, get_infrastructure_template, PREDEFINED_TEMPLATES
 from src.utils.aws_config import get_bedrock_llm
 
+# Regex cho manual fallback - compile một lần khi import thay vì mỗi lần parse
+_INSTANCE_TYPE_RE = re.compile(r'(t3\.|t2\.|m5\.|c5\.|r5\.)\w+')
+_EC2_QUANTITY_RE = re.compile(r'(\d+)\s*(ec2|instance)')
+_STORAGE_AMOUNT_RE = re.compile(r'(\d+)\s*(gb|tb)')
+
+def _validate_ec2_config(config: Dict[str, Any]) -> List[str]:
+    """Validate EC2 configuration"""
+    errors = []
+    if not config.get("instance_type"):
+        errors.append("EC2: Missing instance_type")
+    if not config.get("quantity") or config["quantity"] < 1:
+        errors.append("EC2: Invalid quantity")
+    return errors
+
+
+def _validate_rds_config(config: Dict[str, Any]) -> List[str]:
+    """Validate RDS configuration"""
+    errors = []
+    if not config.get("engine"):
+        errors.append("RDS: Missing engine")
+    if not config.get("instance_class"):
+        errors.append("RDS: Missing instance_class")
+    return errors
+
+
 class TemplateParser:
+    # Validator theo service type - lookup O(1) thay vì if/elif chain
+    _CONFIG_VALIDATORS = {
+        "ec2": _validate_ec2_config,
+        "rds": _validate_rds_config
+    }
+    
     def __init__(self):
         self.llm = get_bedrock_llm(temperature=0.1)
     
@@ -159,20 +190,13 @@ class TemplateParser:
     
     def validate_configuration(self, services: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate configuration trước khi gửi tới calculator"""
-        errors = []
-        
-        for service_type, config in services.items():
-            if service_type == "ec2":
-                if not config.get("instance_type"):
-                    errors.append("EC2: Missing instance_type")
-                if not config.get("quantity") or config["quantity"] < 1:
-                    errors.append("EC2: Invalid quantity")
-            
-            elif service_type == "rds":
-                if not config.get("engine"):
-                    errors.append("RDS: Missing engine")
-                if not config.get("instance_class"):
-                    errors.append("RDS: Missing instance_class")
+        validators = self._CONFIG_VALIDATORS
+        errors = [
+            error
+            for service_type, config in services.items()
+            if service_type in validators
+            for error in validators[service_type](config)
+        ]
         
         return len(errors) == 0, errors 
     
@@ -185,15 +209,15 @@ class TemplateParser:
         
         # Parse EC2
         if any(keyword in text_lower for keyword in ["ec2", "instance", "server"]):
-            ec2_config = get_service_template("ec2", "default")
+            ec2_config = get_service_template("ec2", "default", copy=True)
             
             # Extract instance type
-            instance_match = re.search(r'(t3\.|t2\.|m5\.|c5\.|r5\.)\w+', text_lower)
+            instance_match = _INSTANCE_TYPE_RE.search(text_lower)
             if instance_match:
                 ec2_config["instance_type"] = instance_match.group(0)
             
             # Extract quantity  
-            quantity_match = re.search(r'(\d+)\s*(ec2|instance)', text_lower)
+            quantity_match = _EC2_QUANTITY_RE.search(text_lower)
             if quantity_match:
                 ec2_config["quantity"] = int(quantity_match.group(1))
             
@@ -203,20 +227,20 @@ class TemplateParser:
         # Parse RDS
         if any(keyword in text_lower for keyword in ["rds", "database", "postgres", "mysql"]):
             if "postgres" in text_lower:
-                rds_config = get_service_template("rds", "postgresql")
+                rds_config = get_service_template("rds", "postgresql", copy=True)
                 auto_filled.append("RDS: Using PostgreSQL template")
             else:
-                rds_config = get_service_template("rds", "default")
+                rds_config = get_service_template("rds", "default", copy=True)
                 auto_filled.append("RDS: Using default template")
             
             services["rds"] = rds_config
         
         # Parse S3
         if any(keyword in text_lower for keyword in ["s3", "storage", "bucket"]):
-            s3_config = get_service_template("s3", "default")
+            s3_config = get_service_template("s3", "default", copy=True)
             
             # Extract storage amount
-            storage_match = re.search(r'(\d+)\s*(gb|tb)', text_lower)
+            storage_match = _STORAGE_AMOUNT_RE.search(text_lower)
             if storage_match:
                 amount = int(storage_match.group(1))
                 unit = storage_match.group(2).upper()
@@ -228,13 +252,13 @@ class TemplateParser:
         
         # Parse Load Balancer
         if any(keyword in text_lower for keyword in ["load balancer", "alb", "balancer"]):
-            lb_config = get_service_template("load_balancer", "default")
+            lb_config = get_service_template("load_balancer", "default", copy=True)
             services["load_balancer"] = lb_config
             auto_filled.append("Load Balancer: Using default ALB template")
         
         # Parse VPC
         if any(keyword in text_lower for keyword in ["vpc", "network", "nat"]):
-            vpc_config = get_service_template("vpc", "default")
+            vpc_config = get_service_template("vpc", "default", copy=True)
             services["vpc"] = vpc_config
             auto_filled.append("VPC: Using default template with NAT Gateway")
         
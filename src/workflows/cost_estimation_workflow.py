@@ -12,17 +12,16 @@ from src.monitoring.logger import (
     log_service_event, start_performance_monitoring,
     end_performance_monitoring
 )
-# Import service modules to register services
-from src.services import (
-    compute_services,
-    ai_ml_services,
-    database_services,
-    storage_services,
-    networking_services
-)
 
 logger = logging.getLogger(__name__)
 
+# Thứ tự add services (infrastructure trước); services khác giữ nguyên thứ tự và đứng sau
+_SERVICE_PRIORITY = {
+    service_type: index
+    for index, service_type in enumerate(("vpc", "ec2", "rds", "s3", "load_balancer"))
+}
+_DEFAULT_PRIORITY = len(_SERVICE_PRIORITY)
+
 class EstimationState(TypedDict):
     user_input: str
     parsed_services: Dict[str, Any]
@@ -99,7 +98,7 @@ class CostEstimationWorkflow:
             state["added_services"] = []
             state["failed_services"] = []
             
-            print(f"✅ Parsed services: {list(services.keys())}")
+            print(f"✅ Parsed services: {list(services)}")
             print(f"📝 Auto-filled info: {auto_filled}")
             
         except Exception as e:
@@ -143,16 +142,18 @@ class CostEstimationWorkflow:
             services_to_add = state.get("services_to_add", [])
 
             # Use services_to_add order but get config from parsed_services
-            all_services_config = {}
-            for service_type in services_to_add:
-                if service_type in parsed_services:
-                    all_services_config[service_type] = parsed_services[service_type]
+            all_services_config = {
+                service_type: parsed_services[service_type]
+                for service_type in services_to_add
+                if service_type in parsed_services
+            }
 
             if not all_services_config:
                 # Fallback: use all parsed services if services_to_add is empty
                 all_services_config = parsed_services
 
-            logger.info(f"📋 Executing orchestrated workflow for {len(all_services_config)} services: {list(all_services_config.keys())}")
+            service_keys = list(all_services_config)
+            logger.info("📋 Executing orchestrated workflow for %d services: %s", len(service_keys), service_keys)
 
             # Execute workflow using service orchestrator
             result = await self.service_orchestrator.run_estimation(all_services_config)
@@ -161,23 +162,23 @@ class CostEstimationWorkflow:
                 state["added_services"] = result.get("services_added", [])
                 state["estimate_links"] = result.get("estimate_links", {})
                 state["failed_services"] = result.get("services_failed", [])
-                logger.info(f"✅ Orchestrated workflow successful: {len(state['added_services'])} services added")
+                logger.info("✅ Orchestrated workflow successful: %d services added", len(state['added_services']))
                 end_performance_monitoring(operation_id, success=True,
                                          metadata={"services_count": len(state["added_services"])})
             else:
                 state["error_message"] = result.get("error", "Unknown workflow error")
-                state["failed_services"] = list(all_services_config.keys())
+                state["failed_services"] = service_keys
                 state["added_services"] = []
-                logger.error(f"❌ Orchestrated workflow failed: {state['error_message']}")
+                logger.error("❌ Orchestrated workflow failed: %s", state['error_message'])
                 end_performance_monitoring(operation_id, success=False,
                                          error_message=state["error_message"])
 
         except Exception as e:
             error_msg = f"Orchestrated workflow error: {str(e)}"
             state["error_message"] = error_msg
-            state["failed_services"] = list(state.get("parsed_services", {}).keys())
+            state["failed_services"] = list(state.get("parsed_services", {}))
             state["added_services"] = []
-            logger.error(f"❌ Orchestrated workflow error: {e}")
+            logger.error("❌ Orchestrated workflow error: %s", e)
             end_performance_monitoring(operation_id, success=False, error_message=error_msg)
 
         return state
@@ -186,18 +187,12 @@ class CostEstimationWorkflow:
         """Prepare queue of services to add"""
         try:
             services = state.get("parsed_services", {})
-            service_order = ["vpc", "ec2", "rds", "s3", "load_balancer"]  # Thứ tự add services
-            
-            # Sắp xếp services theo thứ tự ưu tiên
-            ordered_services = []
-            for service_type in service_order:
-                if service_type in services:
-                    ordered_services.append(service_type)
             
-            # Add any remaining services
-            for service_type in services:
-                if service_type not in ordered_services:
-                    ordered_services.append(service_type)
+            # Sắp xếp services theo thứ tự ưu tiên (sorted stable - remaining services giữ thứ tự gốc)
+            ordered_services = sorted(
+                services,
+                key=lambda service_type: _SERVICE_PRIORITY.get(service_type, _DEFAULT_PRIORITY)
+            )
             
             state["services_to_add"] = ordered_services
             state["current_service_index"] = 0
@@ -216,7 +211,7 @@ class CostEstimationWorkflow:
         try:
             result = {
                 "status": "success",
-                "services_requested": list(state.get("parsed_services", {}).keys()),
+                "services_requested": list(state.get("parsed_services", {})),
                 "services_added": state.get("added_services", []),
                 "services_failed": state.get("failed_services", []),
                 "auto_filled_info": state.get("auto_filled_info", []),
@@ -243,7 +238,7 @@ class CostEstimationWorkflow:
         result = {
             "status": "error",
             "error": error_msg,
-            "services_requested": list(state.get("parsed_services", {}).keys()),
+            "services_requested": list(state.get("parsed_services", {})),
             "auto_filled_info": state.get("auto_filled_info", [])
         }
         
@@ -271,7 +266,7 @@ class CostEstimationWorkflow:
             error_message=""
         )
 
-        logger.info(f"🚀 Starting cost estimation for: {user_input[:100]}...")
+        logger.info("🚀 Starting cost estimation for: %s...", user_input[:100])
 
         try:
             final_state = await self.workflow.ainvoke(initial_state)
@@ -287,7 +282,7 @@ class CostEstimationWorkflow:
 
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
-            logger.error(f"❌ Workflow error: {e}")
+            logger.error("❌ Workflow error: %s", e)
 
             # End monitoring with error
             end_workflow_monitoring(success=False, error_message=error_msg)
@@ -10,8 +10,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Fix Windows asyncio event loop policy
-if sys.platform == "win32":
+# Fix Windows asyncio event loop policy (Streamlit re-runs script mỗi interaction - chỉ set một lần)
+if sys.platform == "win32" and not isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 # Enable nested async (cần cho Streamlit)
@@ -424,8 +424,8 @@ def main():
 
         if st.button("📋 Clear History"):
             st.session_state.estimation_history = []
-            enhanced_logger.performance_monitor.metrics.clear()
-            enhanced_logger.workflow_monitor.events.clear()
+            enhanced_logger.performance_monitor.clear()
+            enhanced_logger.workflow_monitor.clear()
             st.experimental_rerun()
 
         # Debug toggle
@@ -0,0 +1 @@
+# Tests for AWS Cost Estimation Agent
@@ -0,0 +1,104 @@
+"""Tests for the two-level estimate result cache"""
+
+import json
+import time
+
+import pytest
+
+from src.utils import result_cache
+from src.utils.result_cache import EstimateResultCache, config_cache_key
+
+RESULT = {"status": "success", "estimate_links": ["https://calculator.aws/#/estimate?id=abc"]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EstimateResultCache(cache_dir=str(tmp_path / "estimates"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module"""
+    now = [time.time()]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_config_cache_key_ignores_key_order():
+    assert config_cache_key({"a": 1, "b": {"x": 1, "y": 2}}) == config_cache_key({"b": {"y": 2, "x": 1}, "a": 1})
+    assert config_cache_key({"a": 1}) != config_cache_key({"a": 2})
+
+
+def test_get_returns_stored_result(cache):
+    cache.set("key", RESULT)
+    assert cache.get("key", ttl_seconds=60) == RESULT
+
+
+def test_memory_entry_expires_after_ttl(cache, clock):
+    cache.set("key", RESULT)
+    clock[0] += 61
+    assert cache.get("key", ttl_seconds=60) is None
+    assert "key" not in cache._memory
+
+
+def test_disk_entry_expires_after_ttl(cache, tmp_path, clock):
+    cache.set("key", RESULT)
+    fresh = EstimateResultCache(cache_dir=str(tmp_path / "estimates"))
+    assert fresh.get("key", ttl_seconds=60) == RESULT
+
+    clock[0] += 61
+    expired = EstimateResultCache(cache_dir=str(tmp_path / "estimates"))
+    assert expired.get("key", ttl_seconds=60) is None
+
+
+def test_zero_ttl_bypasses_cache(cache):
+    cache.set("key", RESULT)
+    assert cache.get("key", ttl_seconds=0) is None
+    assert cache.get("key", ttl_seconds=-1) is None
+
+
+def test_set_stores_a_copy(cache):
+    result = {"estimate_links": ["a"]}
+    cache.set("key", result)
+    result["estimate_links"].append("b")
+    assert cache.get("key", ttl_seconds=60) == {"estimate_links": ["a"]}
+
+
+def test_get_returns_a_copy(cache):
+    cache.set("key", RESULT)
+    first = cache.get("key", ttl_seconds=60)
+    first["cached"] = True
+    first["estimate_links"].append("mutated")
+    assert cache.get("key", ttl_seconds=60) == RESULT
+
+
+def test_disk_hit_is_isolated_from_memory(cache, tmp_path):
+    cache.set("key", RESULT)
+    fresh = EstimateResultCache(cache_dir=str(tmp_path / "estimates"))
+    fresh.get("key", ttl_seconds=60)["estimate_links"].append("mutated")
+    assert fresh.get("key", ttl_seconds=60) == RESULT
+
+
+def test_corrupt_file_is_a_miss(cache, tmp_path):
+    path = tmp_path / "estimates" / "key.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.get("key", ttl_seconds=60) is None
+
+
+def test_missing_file_is_a_miss(cache):
+    assert cache.get("missing", ttl_seconds=60) is None
+
+
+def test_set_writes_json_entry(cache, tmp_path):
+    cache.set("key", RESULT)
+    entry = json.loads((tmp_path / "estimates" / "key.json").read_text(encoding="utf-8"))
+    assert entry["result"] == RESULT
+    assert not list((tmp_path / "estimates").glob("*.tmp"))
+
+
+def test_memory_is_bounded(tmp_path):
+    cache = EstimateResultCache(cache_dir=str(tmp_path), memory_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, RESULT)
+    assert list(cache._memory) == ["b", "c"]
@@ -0,0 +1,94 @@
+"""Tests for the per-service agent step statistics"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.monitoring.step_stats import MAX_SAMPLES, MIN_SAMPLES, MIN_STEPS, StepStats
+
+
+@pytest.fixture
+def stats_path(tmp_path):
+    return tmp_path / "stats.json"
+
+
+@pytest.fixture
+def stats(stats_path):
+    return StepStats(stats_path=str(stats_path))
+
+
+def test_default_below_min_samples(stats):
+    for _ in range(MIN_SAMPLES - 1):
+        stats.record("s3", 20)
+    assert stats.suggest_max_steps("s3", default=75) == 75
+
+
+def test_uses_history_at_min_samples(stats):
+    for _ in range(MIN_SAMPLES):
+        stats.record("s3", 20)
+    # Identical samples: stdev is 0, so the budget is the mean
+    assert stats.suggest_max_steps("s3", default=75) == 20
+
+
+def test_budget_is_mean_plus_two_stdev(stats):
+    for steps in (10, 20, 30):
+        stats.record("ec2", steps)
+    # mean 20, population stdev ~8.16 -> ceil(36.33)
+    assert stats.suggest_max_steps("ec2", default=75) == 37
+
+
+def test_budget_never_exceeds_default(stats):
+    for steps in (60, 80, 100):
+        stats.record("ec2", steps)
+    assert stats.suggest_max_steps("ec2", default=50) == 50
+
+
+def test_budget_never_below_min_steps(stats):
+    for _ in range(MIN_SAMPLES):
+        stats.record("vpc", 1)
+    assert stats.suggest_max_steps("vpc", default=75) == MIN_STEPS
+
+
+def test_non_positive_steps_are_ignored(stats):
+    stats.record("s3", 0)
+    stats.record("s3", -5)
+    assert "s3" not in stats._samples
+    assert not stats._dirty
+
+
+def test_keeps_only_recent_samples(stats):
+    for steps in range(1, MAX_SAMPLES + 11):
+        stats.record("s3", steps)
+    assert stats._samples["s3"] == list(range(11, MAX_SAMPLES + 11))
+
+
+def test_save_round_trip(stats, stats_path):
+    for steps in (12, 14, 16):
+        stats.record("s3", steps)
+    asyncio.run(stats.save())
+
+    assert json.loads(stats_path.read_text(encoding="utf-8")) == {"s3": [12, 14, 16]}
+    reloaded = StepStats(stats_path=str(stats_path))
+    assert reloaded.suggest_max_steps("s3", default=75) == stats.suggest_max_steps("s3", default=75)
+
+
+def test_save_skips_write_when_clean(stats, stats_path):
+    asyncio.run(stats.save())
+    assert not stats_path.exists()
+
+
+@pytest.mark.parametrize("content", [
+    "{not json",
+    "[1, 2, 3]",
+    '{"s3": ["many"]}',
+    '{"s3": [{"steps": 3}]}',
+])
+def test_corrupt_file_loads_empty(stats_path, content):
+    stats_path.write_text(content, encoding="utf-8")
+    assert StepStats(stats_path=str(stats_path))._samples == {}
+
+
+def test_load_skips_non_list_entries(stats_path):
+    stats_path.write_text(json.dumps({"s3": [10, 20], "ec2": 5}), encoding="utf-8")
+    assert StepStats(stats_path=str(stats_path))._samples == {"s3": [10, 20]}